@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Memory/load-time benchmark: WeekState records vs the equivalent ORM object graph.
+
+Builds a throwaway SQLite file with fully drafted, fully resulted weeks, then loads each
+week both ways while tracemalloc is running and reports the retained bytes per week and the
+mean load time. The ORM side loads what the views used to read (players, fixtures, results,
+matchups, picks) through one Session, so the identity map and instance state count too.
+
+  python bench_week_state.py --weeks 10
+  python bench_week_state.py --weeks 38 --repeat 5 --json bench.json
+"""
+import argparse
+import gc
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PLAYERS = ["Ana", "Ben", "Cat", "Dan", "Eve", "Fin"]
+
+
+def seed(m, csv_path: str, weeks: int) -> None:
+    """Initialize weeks, draft every fixture in every matchup and set all results."""
+    m.init_weeks_from_csv(csv_path, range(1, weeks + 1), PLAYERS, "bench")
+    db = m.SessionLocal()
+    t0 = datetime(2025, 8, 1, 12, 0, 0)
+    for wk in db.query(m.Week).order_by(m.Week.number):
+        fixtures = db.query(m.Fixture).filter_by(week_id=wk.id).order_by(m.Fixture.match_number).all()
+        for mu in db.query(m.Matchup).filter_by(week_id=wk.id):
+            for i, fx in enumerate(fixtures):
+                db.add(m.Pick(matchup_id=mu.id, player_id=m.turn_after(mu, i), fixture_id=fx.id,
+                              team=random.choice((fx.home, fx.away)), created_at=t0 + timedelta(minutes=i)))
+        for fx in fixtures:
+            db.add(m.Result(fixture_id=fx.id, outcome=random.choice(("Home", "Away", "Draw"))))
+    db.commit()
+    m.SessionLocal.remove()
+
+
+def load_orm(m, db, wk):
+    players = {p.id: p for p in db.query(m.Player).all()}
+    fixtures = db.query(m.Fixture).filter_by(week_id=wk.id).order_by(m.Fixture.match_number.asc()).all()
+    results = {r.fixture_id: r.outcome for r in db.query(m.Result).join(m.Fixture).filter(m.Fixture.week_id == wk.id)}
+    matchups = db.query(m.Matchup).filter_by(week_id=wk.id).order_by(m.Matchup.id.asc()).all()
+    picks = (db.query(m.Pick).join(m.Matchup).filter(m.Matchup.week_id == wk.id)
+             .order_by(m.Pick.created_at.asc(), m.Pick.id.asc()).all())
+    return players, fixtures, results, matchups, picks
+
+
+def measure(m, load, weeks: int, repeat: int) -> dict:
+    """Retained bytes for holding every week loaded at once, plus mean seconds per week load."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    db = m.SessionFactory()
+    week_rows = db.query(m.Week).order_by(m.Week.number).all()
+    held = [load(m, db, wk) for wk in week_rows]
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del held
+    db.close()
+
+    elapsed = 0.0
+    for _ in range(repeat):
+        db = m.SessionFactory()
+        week_rows = db.query(m.Week).order_by(m.Week.number).all()
+        start = time.perf_counter()
+        for wk in week_rows:
+            load(m, db, wk)
+        elapsed += time.perf_counter() - start
+        db.close()
+    return {"retained_bytes": retained, "bytes_per_week": retained // weeks,
+            "ms_per_load": round(1000 * elapsed / (repeat * weeks), 3)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare WeekState vs ORM graph memory per week")
+    parser.add_argument("--weeks", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3, help="Timed passes over all weeks")
+    parser.add_argument("--csv", default=os.path.join(HERE, "epl_2025.csv"))
+    parser.add_argument("--json", dest="json_out", help="Also write the report as JSON to this path")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="pickem-bench-")
+    os.environ["DB_PATH"] = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    os.environ["KICKOFF_SCHEDULER"] = "0"
+    sys.path.insert(0, HERE)
+    cwd = os.getcwd()
+    os.chdir(workdir)  # flask-session writes its directory relative to cwd
+    try:
+        import pickem_flask_htmx_tabs as m
+        random.seed(1)
+        seed(m, args.csv, args.weeks)
+        report = {
+            "weeks": args.weeks,
+            "orm": measure(m, load_orm, args.weeks, args.repeat),
+            "week_state": measure(m, lambda m, db, wk: m.WeekState(db, wk), args.weeks, args.repeat),
+        }
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"{'graph':12} {'bytes/week':>12} {'ms/load':>9}")
+    for name in ("orm", "week_state"):
+        r = report[name]
+        print(f"{name:12} {r['bytes_per_week']:>12} {r['ms_per_load']:>9}")
+    report["ratio"] = round(report["orm"]["bytes_per_week"] / max(report["week_state"]["bytes_per_week"], 1), 2)
+    print(f"ORM graph uses {report['ratio']}x the memory of WeekState")
+    if args.json_out:
+        with open(args.json_out, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,48 @@
 #!/usr/bin/env python3
 import argparse
+import cProfile
+import csv
+import gzip
+import hashlib
+import heapq
+import io
+import itertools
+import json
+import mmap
 import os
+import pstats
+import queue
 import random
-from datetime import datetime
-from typing import List, Tuple, Dict, Iterable, Optional
-
-from flask import Flask, request, session, redirect, url_for, render_template_string, abort
+import re
+import sqlite3
+import struct
+import sys
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import Future
+from datetime import datetime, timedelta, timezone
+from typing import List, Tuple, Dict, Iterable, Optional, Callable
+from zoneinfo import ZoneInfo
+
+from flask import Flask, request, session, redirect, url_for, render_template_string, abort, jsonify, Response, g, send_from_directory
 from flask_session import Session
 from sqlalchemy import (
-    create_engine, Column, Integer, String, ForeignKey, UniqueConstraint, DateTime, event
+    create_engine, Column, Integer, String, Text, ForeignKey, UniqueConstraint, DateTime, Index, event,
+    inspect, or_, text
 )
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import sessionmaker, declarative_base, relationship, scoped_session
 from jinja2 import DictLoader
+import msgspec
+import numpy as np
 import pandas as pd
 
+try:  # optional: brotli variants are served only when the package is installed
+    import brotli
+except ImportError:
+    brotli = None
+
 # -------------------- In-memory base + partial templates --------------------
 BASE_HTML = """
 <!doctype html>
@@ -21,33 +50,8 @@ BASE_HTML = """
 <head>
   <meta charset="utf-8">
   <title>EPL Pick 'Em</title>
-  <script src="https://unpkg.com/htmx.org@2.0.2"></script>
-  <style>
-    :root { --blue:#0ea5e9; }
-    body { font-family: -apple-system, system-ui, Segoe UI, Roboto, sans-serif; margin: 24px; color: #111; }
-    a { color: var(--blue); text-decoration: none; }
-    nav { display:flex; gap:12px; align-items:center; margin-bottom:16px; }
-    .tabs { display:flex; gap:8px; align-items:center; }
-    .tab { padding:8px 12px; border:1px solid #ddd; border-radius:999px; cursor:pointer; background:#f8f8f8; }
-    .tab.active { background:var(--blue); color:#fff; border-color:#0284c7; }
-    .navright { margin-left:auto; }
-    .card { border: 1px solid #ddd; border-radius: 12px; padding: 16px; margin: 12px 0; box-shadow: 0 1px 4px rgba(0,0,0,0.04); }
-    .row { display: flex; gap: 16px; flex-wrap: wrap; }
-    .col { flex: 1; min-width: 320px; }
-    .btn { padding: 8px 12px; border: 1px solid #ccc; background: #f8f8f8; border-radius: 8px; cursor: pointer; }
-    .btn.primary { background: var(--blue); color: white; border-color: #0284c7; }
-    .muted { color: #666; }
-    .badge { display: inline-block; padding: 2px 8px; background: #eef; border: 1px solid #aac; border-radius: 999px; font-size: 12px; }
-    select, input { padding: 6px; border: 1px solid #ccc; border-radius: 6px; }
-    table { width: 100%; border-collapse: collapse; }
-    th, td { text-align: left; padding: 6px 8px; border-bottom: 1px solid #eee; }
-    .grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(220px, 1fr)); gap: 8px; }
-    .chip { border: 1px solid #ddd; border-radius: 999px; padding: 6px 10px; display: flex; justify-content: space-between; align-items: center; }
-    .status { display:inline-block; padding:2px 8px; border-radius:999px; border:1px solid #ccc; font-size:12px; }
-    .status.drafting { background:#eef; border-color:#99c; }
-    .status.provisional { background:#ffe; border-color:#cc9; }
-    .status.finalized { background:#efe; border-color:#9c9; }
-  </style>
+  <script src="{{ asset_url('htmx.min.js') }}"></script>
+  <link rel="stylesheet" href="{{ asset_url('pickem.css') }}">
 </head>
 <body>
   <nav>
@@ -67,12 +71,17 @@ BASE_HTML = """
               hx-target="#main" hx-swap="innerHTML" hx-push-url="true">
         Season
       </button>
+      <button class="tab {% if active_tab=='stats' %}active{% endif %}"
+              hx-get="{{ url_for('tab_stats') }}"
+              hx-target="#main" hx-swap="innerHTML" hx-push-url="true">
+        Stats
+      </button>
     </div>
     <div class="navright muted">Logged in as: {{ you.name if you else 'Guest' }}</div>
   </nav>
 
   <div id="main">
-    {% block body %}{% endblock %}
+    {% block body %}{{ body|safe if body }}{% endblock %}
   </div>
 </body>
 </html>
@@ -85,19 +94,8 @@ ADMIN_HTML = """
 <head>
   <meta charset="utf-8">
   <title>EPL Pick 'Em — Admin</title>
-  <script src="https://unpkg.com/htmx.org@2.0.2"></script>
-  <style>
-    body { font-family: -apple-system, system-ui, Segoe UI, Roboto, sans-serif; margin: 24px; color:#111; }
-    .card { border: 1px solid #ddd; border-radius: 12px; padding: 16px; margin: 12px 0; box-shadow: 0 1px 4px rgba(0,0,0,0.04); }
-    .row { display:flex; gap:16px; flex-wrap:wrap; }
-    .col { flex:1; min-width: 320px; }
-    table { width: 100%; border-collapse: collapse; }
-    th, td { text-align:left; padding:6px 8px; border-bottom:1px solid #eee; }
-    select, input { padding:6px; border:1px solid #ccc; border-radius:6px; }
-    .btn { padding:8px 12px; border:1px solid #ccc; background:#f8f8f8; border-radius:8px; cursor:pointer; }
-    .btn.primary { background:#0ea5e9; color:#fff; border-color:#0284c7; }
-    .muted { color:#666; }
-  </style>
+  <script src="{{ asset_url('htmx.min.js') }}"></script>
+  <link rel="stylesheet" href="{{ asset_url('pickem.css') }}">
 </head>
 <body>
   <div class="card">
@@ -111,6 +109,7 @@ ADMIN_HTML = """
     {% else %}
       <form method="post" action="{{ url_for('admin_logout') }}" style="margin-bottom:8px;">
         <button class="btn" type="submit">Lock Admin</button>
+        <a class="btn" href="{{ url_for('admin_profiles') }}">Profiles</a>
       </form>
 
       <div class="card">
@@ -176,7 +175,7 @@ def is_admin_session() -> bool:
 JOIN_HTML = """
 <!doctype html>
 <html><head><meta charset="utf-8"><title>Join</title>
-  <style>body{font-family:-apple-system,system-ui,Segoe UI,Roboto,sans-serif;margin:24px;} .card{border:1px solid #ddd;border-radius:12px;padding:16px;}</style>
+  <link rel="stylesheet" href="{{ asset_url('pickem.css') }}">
 </head><body>
 <div class="card">
   <h2>Join EPL Pick 'Em</h2>
@@ -202,19 +201,13 @@ CURRENT_PARTIAL = """
       <div>Status: <span class="status {{ wk.status }}">{{ wk.status|capitalize }}</span></div>
     </div>
 
-    <div class="card" id="fixtures" hx-get="{{ url_for('fixtures_partial', week_number=wk.number) }}" hx-trigger="load">
-      Loading fixtures...
-    </div>
+    <div class="card" id="fixtures">{{ fixtures_html|safe }}</div>
 
-    <div class="card" id="scores" hx-get="{{ url_for('scores_partial', week_number=wk.number) }}" hx-trigger="load">
-      Loading scores...
-    </div>
+    <div class="card" id="scores">{{ scores_html|safe }}</div>
   </div>
 
   <div class="col">
-    <div id="matchups" class="card" hx-get="{{ url_for('matchups_partial', week_number=wk.number) }}" hx-trigger="load">
-      Loading matchups...
-    </div>
+    <div id="matchups" class="card">{{ matchups_html|safe }}</div>
   </div>
 </div>
 """
@@ -242,8 +235,8 @@ OPEN_PARTIAL = """
 </div>
 """
 
-SEASON_PARTIAL = """
-<div class="card">
+SEASON_TOTALS_PARTIAL = """
+<div class="card" id="season-totals">
   <h3>Season Summary (Final weeks only)</h3>
   <p class="muted">Cumulative points from finalized weeks. Net = For – Against.</p>
   <table>
@@ -255,9 +248,14 @@ SEASON_PARTIAL = """
     </tbody>
   </table>
 </div>
+"""
+
+SEASON_PARTIAL = """
+{{ totals_html|safe }}
 
 <div class="card">
   <h4>Weekly rollup</h4>
+  <p class="muted">Most recent weeks first; older weeks load as you scroll. {{ snapshot_label(as_of) }}.</p>
   <table>
     <thead>
       <tr>
@@ -267,25 +265,39 @@ SEASON_PARTIAL = """
       </tr>
     </thead>
     <tbody>
-      {% for wk in weeks %}
-      <tr>
-        <td><a href="#" hx-get="{{ url_for('tab_current') }}?force_week={{ wk.number }}" hx-target="#main" hx-swap="innerHTML" hx-push-url="true">Week {{ wk.number }}</a></td>
-        {% for p in players %}
-          <td>{{ weekly_points[wk.number].get(p.id, 0) }}</td>
-        {% endfor %}
-        <td><span class="status {{ wk.status }}">{{ wk.status|capitalize }}</span></td>
-      </tr>
-      {% endfor %}
+      {% if has_weeks %}
+        <tr hx-get="{{ url_for('season_weeks_partial') }}" hx-trigger="revealed" hx-swap="outerHTML">
+          <td colspan="{{ players|length + 2 }}" class="muted">Loading weeks…</td>
+        </tr>
+      {% endif %}
     </tbody>
   </table>
 </div>
 """
 
+SEASON_WEEKS_PARTIAL = """
+{% for wk in weeks %}
+<tr>
+  <td><a href="#" hx-get="{{ url_for('tab_current') }}?force_week={{ wk.number }}" hx-target="#main" hx-swap="innerHTML" hx-push-url="true">Week {{ wk.number }}</a></td>
+  {% for p in players %}
+    <td>{{ weekly_points[wk.number].get(p.id, 0) }}</td>
+  {% endfor %}
+  <td><span class="status {{ wk.status }}">{{ wk.status|capitalize }}</span></td>
+</tr>
+{% endfor %}
+{% if next_before %}
+<tr hx-get="{{ url_for('season_weeks_partial', before=next_before) }}" hx-trigger="revealed, click" hx-swap="outerHTML">
+  <td colspan="{{ players|length + 2 }}"><button class="btn" type="button">Load older weeks</button></td>
+</tr>
+{% endif %}
+"""
+
 FIXTURES_PARTIAL = """
 <h4>Fixtures</h4>
 <div class="grid">
 {% for f in fixtures %}
-  <div class="chip"><span>#{{ f.match_number }}: {{ f.home }} vs {{ f.away }}</span></div>
+  <div class="chip"><span>#{{ f.match_number }}: {{ f.home }} vs {{ f.away }}</span>
+    {% if f.kickoff %}<span class="muted">{{ f.kickoff.strftime('%a %d %b %H:%M') }} UTC</span>{% endif %}</div>
 {% endfor %}
 </div>
 """
@@ -416,6 +428,101 @@ SCORES_PARTIAL = """
 </div>
 """
 
+STATS_PARTIAL = """
+<div class="card">
+  <h3>Head-to-head (all seasons)</h3>
+  <p class="muted">Wins–Losses–Draws of the row player against each opponent in finalized weeks. {{ snapshot_label(as_of) }}.</p>
+  <table>
+    <thead><tr><th>Player</th>{% for o in names %}<th>{{ o }}</th>{% endfor %}</tr></thead>
+    <tbody>
+      {% for p in names %}
+        <tr>
+          <td>{{ p }}</td>
+          {% for o in names %}
+            {% set r = h2h.get((p, o)) %}
+            <td>{% if p == o %}—{% elif r %}{{ r['wins'] }}–{{ r['losses'] }}–{{ r['draws'] }}{% else %}<span class="muted">0–0–0</span>{% endif %}</td>
+          {% endfor %}
+        </tr>
+      {% endfor %}
+    </tbody>
+  </table>
+</div>
+
+<div class="row">
+  <div class="col">
+    <div class="card">
+      <h4>Favourite teams</h4>
+      <table>
+        <thead><tr><th>Player</th><th>Team</th><th>Picks</th><th>Hit rate</th></tr></thead>
+        <tbody>
+          {% for r in teams %}
+            <tr><td>{{ r['player'] }}</td><td>{{ r['team'] }}</td><td>{{ r['picks'] }}</td><td>{{ r['hit_rate'] }}</td></tr>
+          {% endfor %}
+        </tbody>
+      </table>
+    </div>
+  </div>
+  <div class="col">
+    <div class="card">
+      <h4>Home vs away hit rate</h4>
+      <table>
+        <thead><tr><th>Player</th><th>Side</th><th>Picks</th><th>W–L–D</th><th>Hit rate</th></tr></thead>
+        <tbody>
+          {% for r in sides %}
+            <tr><td>{{ r['player'] }}</td><td>{{ r['side'] }}</td><td>{{ r['picks'] }}</td><td>{{ r['wins'] }}–{{ r['losses'] }}–{{ r['draws'] }}</td><td>{{ r['hit_rate'] }}</td></tr>
+          {% endfor %}
+        </tbody>
+      </table>
+    </div>
+  </div>
+</div>
+"""
+
+
+PROFILES_HTML = """
+<!doctype html>
+<html>
+<head>
+  <meta charset="utf-8">
+  <title>EPL Pick 'Em — Profiles</title>
+  <link rel="stylesheet" href="{{ asset_url('pickem.css') }}">
+</head>
+<body>
+  <div class="card">
+    <h2>Admin — Sampled Request Profiles</h2>
+    <form method="post" action="{{ url_for('admin_profiler_rates') }}" style="margin-bottom:8px;">
+      <label>Sample rates
+        <input name="rates" value="{{ rates }}" size="60" placeholder="*=0.05,/partials/matchups/<int:week_number>=1">
+      </label>
+      <button class="btn primary" type="submit">Apply</button>
+      <span class="muted">Empty = off. Writing to {{ directory }} (last {{ keep }} kept).</span>
+    </form>
+    <table>
+      <thead><tr><th>When (UTC)</th><th>Route</th><th>Path</th><th>ms</th><th>Top functions (own time)</th><th>Files</th></tr></thead>
+      <tbody>
+        {% for s in samples %}
+          <tr>
+            <td>{{ s['at'] }}</td>
+            <td>{{ s['method'] }} {{ s['route'] }}</td>
+            <td>{{ s['path'] }}</td>
+            <td>{{ s['ms'] }}</td>
+            <td>
+              {% for fn in s['top'] %}<div>{{ fn['ms'] }} ms × {{ fn['calls'] }} — {{ fn['function'] }}</div>{% endfor %}
+            </td>
+            <td>
+              <a href="{{ url_for('admin_profile_file', name=s['name'] + '.prof') }}">pstats</a>
+              <a href="{{ url_for('admin_profile_file', name=s['name'] + '.folded') }}">folded</a>
+            </td>
+          </tr>
+        {% else %}
+          <tr><td colspan="6" class="muted">No sampled requests yet.</td></tr>
+        {% endfor %}
+      </tbody>
+    </table>
+  </div>
+</body>
+</html>
+"""
 
 # -------------------- App + DB --------------------
 DB_PATH = os.environ.get("DB_PATH", "sqlite:///pickem.db")
@@ -430,7 +537,9 @@ Session(app)
 app.jinja_loader = DictLoader({'base.html': BASE_HTML})
 
 engine = create_engine(DB_PATH, connect_args={"check_same_thread": False})
-SessionLocal = scoped_session(sessionmaker(bind=engine))
+SessionFactory = sessionmaker(bind=engine)
+SessionLocal = scoped_session(SessionFactory)
+_json_encoder = msgspec.json.Encoder()
 Base = declarative_base()
 
 # --- SQLite performance pragmas (better concurrency) ---
@@ -445,9 +554,256 @@ def set_sqlite_pragma(dbapi_connection, connection_record):
         pass
 
 # --- Ensure sessions are cleaned up every request (prevents locks) ---
+def read_consistently(fn: Callable):
+    """Run fn(db) on its own session pinned to one SQLite read transaction.
+
+    pysqlite sends no BEGIN before SELECTs, so consecutive queries on a regular session can
+    each see a different commit. An explicit deferred BEGIN makes them share one snapshot.
+    """
+    with engine.connect() as conn:
+        conn.exec_driver_sql("BEGIN")
+        db = SessionFactory(bind=conn)
+        try:
+            return fn(db)
+        finally:
+            db.close()
+            conn.rollback()
+
 @app.teardown_appcontext
 def remove_session(exception=None):
     SessionLocal.remove()
+    report_db = g.pop("report_db", None)
+    if report_db is not None:
+        report_db.close()
+
+# -------------------- Static assets + response compression --------------------
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+ASSET_MAX_AGE = 365 * 24 * 3600
+COMPRESS_MIN_BYTES = int(os.environ.get("COMPRESS_MIN_BYTES", "1024"))
+COMPRESS_MIMETYPES = {"text/html", "application/json"}
+
+ASSETS: Dict[str, dict] = {}           # logical name -> asset record
+ASSETS_BY_HASHED: Dict[str, dict] = {}  # content-hashed filename -> asset record
+
+def load_assets() -> None:
+    """Read static/ once; fingerprint each file and keep precompressed gzip/brotli bodies."""
+    ASSETS.clear(); ASSETS_BY_HASHED.clear()
+    if not os.path.isdir(STATIC_DIR):
+        return
+    for name in sorted(os.listdir(STATIC_DIR)):
+        path = os.path.join(STATIC_DIR, name)
+        if not os.path.isfile(path):
+            continue
+        with open(path, "rb") as fh:
+            data = fh.read()
+        stem, ext = os.path.splitext(name)
+        digest = hashlib.sha256(data).hexdigest()[:12]
+        bodies = {"identity": data, "gzip": gzip.compress(data, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            bodies["br"] = brotli.compress(data, quality=11)
+        asset = {"name": name, "hashed": f"{stem}.{digest}{ext}", "etag": digest, "bodies": bodies,
+                 "mimetype": {".js": "text/javascript", ".css": "text/css"}.get(ext, "application/octet-stream")}
+        ASSETS[name] = asset
+        ASSETS_BY_HASHED[asset["hashed"]] = asset
+
+load_assets()
+
+@app.template_global()
+def asset_url(name: str) -> str:
+    return url_for("hashed_asset", filename=ASSETS[name]["hashed"])
+
+@app.get("/assets/<path:filename>")
+def hashed_asset(filename: str):
+    """Serve a fingerprinted asset with the best precompressed variant the client accepts."""
+    asset = ASSETS_BY_HASHED.get(filename)
+    if asset is None:
+        abort(404)
+    accepted = request.accept_encodings
+    encoding = next((enc for enc in ("br", "gzip") if enc in asset["bodies"] and accepted[enc]), "identity")
+    resp = Response(asset["bodies"][encoding], mimetype=asset["mimetype"])
+    if encoding != "identity":
+        resp.headers["Content-Encoding"] = encoding
+    resp.headers["Vary"] = "Accept-Encoding"
+    resp.headers["Cache-Control"] = f"public, max-age={ASSET_MAX_AGE}, immutable"
+    resp.set_etag(asset["etag"], weak=True)
+    return resp.make_conditional(request)
+
+@app.after_request
+def compress_response(resp):
+    """Gzip large HTML/JSON responses for clients that accept it."""
+    if (resp.status_code != 200 or resp.direct_passthrough or "Content-Encoding" in resp.headers
+            or resp.mimetype not in COMPRESS_MIMETYPES or not request.accept_encodings["gzip"]):
+        return resp
+    data = resp.get_data()
+    if len(data) < COMPRESS_MIN_BYTES:
+        return resp
+    resp.set_data(gzip.compress(data, compresslevel=6))
+    resp.headers["Content-Encoding"] = "gzip"
+    resp.vary.add("Accept-Encoding")
+    etag, weak = resp.get_etag()
+    if etag and not weak:
+        resp.set_etag(etag, weak=True)  # same entity, different bytes on the wire
+    return resp
+
+# -------------------- Request profiler --------------------
+def parse_profile_rates(spec: str) -> Dict[str, float]:
+    """'0.05' or '*=0.05,/partials/matchups/<int:week_number>=1' -> {url rule or '*': rate}."""
+    rates: Dict[str, float] = {}
+    for part in (spec or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        rule, _, rate = part.rpartition("=") if "=" in part else ("*", "", part)
+        if float(rate) > 0:
+            rates[rule.strip() or "*"] = min(float(rate), 1.0)
+    return rates
+
+class RequestProfiler:
+    """Opt-in per-route request sampling: cProfile pstats + collapsed stacks per sampled request.
+
+    With no rates configured the only cost is one dict truthiness check per request. A
+    sampled request runs under its own cProfile.Profile (per-thread on this Python); a
+    background thread also samples that request thread's stack every `interval` seconds
+    to produce flamegraph-ready collapsed stacks. Each sample writes <name>.prof and
+    <name>.folded into `directory`, keeping the newest `keep` samples there, including
+    those written by earlier runs or other worker processes.
+    """
+
+    def __init__(self, rates: Dict[str, float], directory: str, keep: int, interval: float):
+        self.rates = rates
+        self.directory = directory
+        self.keep = keep
+        self.interval = interval
+        self.samples: List[dict] = []
+        self._seeded = False
+        self._active: Dict[int, Counter] = {}
+        self._lock = threading.Lock()
+        self._sampler: Optional[threading.Thread] = None
+
+    def rate_for(self, rule: str) -> float:
+        return self.rates.get(rule, self.rates.get("*", 0.0))
+
+    def start(self) -> Optional[dict]:
+        prof = cProfile.Profile()
+        try:
+            prof.enable()
+        except ValueError:  # another profiler owns the interpreter (e.g. a debugger)
+            return None
+        ident = threading.get_ident()
+        with self._lock:
+            self._active[ident] = Counter()
+            if self._sampler is None:
+                self._sampler = threading.Thread(target=self._sample_stacks, name="profile-sampler", daemon=True)
+                self._sampler.start()
+        return {"profile": prof, "ident": ident, "started": time.perf_counter()}
+
+    def stop(self, handle: dict, method: str, rule: str, path: str) -> None:
+        handle["profile"].disable()
+        elapsed = time.perf_counter() - handle["started"]
+        with self._lock:
+            stacks = self._active.pop(handle["ident"], Counter())
+        stats = pstats.Stats(handle["profile"])
+        now = datetime.utcnow()
+        slug = "".join(c if c.isalnum() else "_" for c in rule).strip("_") or "root"
+        name = f"{now:%Y%m%dT%H%M%S%f}-{slug}-{int(elapsed * 1000)}ms"
+        os.makedirs(self.directory, exist_ok=True)
+        stats.dump_stats(os.path.join(self.directory, name + ".prof"))
+        with open(os.path.join(self.directory, name + ".folded"), "w") as fh:
+            fh.writelines(f"{stack} {count}\n" for stack, count in stacks.most_common())
+        sample = {"name": name, "at": now.strftime("%Y-%m-%d %H:%M:%S"), "method": method, "route": rule,
+                  "path": path, "ms": round(elapsed * 1000, 1), "top": self._top(stats)}
+        self._seed()
+        names = self._names()  # the directory, not this process's list: restarts and workers share it
+        expired = set(names[:-self.keep])
+        for old in expired:
+            for ext in (".prof", ".folded"):
+                try:
+                    os.remove(os.path.join(self.directory, old + ext))
+                except OSError:
+                    pass
+        with self._lock:
+            self.samples = [s for s in self.samples + [sample] if s["name"] not in expired][-self.keep:]
+
+    def slowest(self, limit: int = 25) -> List[dict]:
+        self._seed()
+        with self._lock:
+            return sorted(self.samples, key=lambda x: x["ms"], reverse=True)[:limit]
+
+    @staticmethod
+    def _top(stats: pstats.Stats) -> List[dict]:
+        top = sorted(stats.stats.items(), key=lambda kv: kv[1][2], reverse=True)[:8]
+        return [{"function": f"{func} ({os.path.basename(file)}:{line})", "calls": nc, "ms": round(tt * 1000, 2)}
+                for (file, line, func), (_, nc, tt, _, _) in top]
+
+    def _names(self) -> List[str]:
+        """Sample names in `directory`, oldest first (names start with their UTC timestamp)."""
+        try:
+            return sorted({f.rsplit(".", 1)[0] for f in os.listdir(self.directory)
+                           if f.endswith((".prof", ".folded"))})
+        except FileNotFoundError:
+            return []
+
+    def _seed(self) -> None:
+        """Once per process: list the samples earlier runs left behind (route/ms from the name)."""
+        if self._seeded:
+            return
+        seeded = []
+        for name in self._names()[-self.keep:]:
+            stamp, _, rest = name.partition("-")
+            slug, _, ms = rest.rpartition("-")
+            try:
+                at = datetime.strptime(stamp, "%Y%m%dT%H%M%S%f")
+                elapsed = float(ms.removesuffix("ms"))
+                top = self._top(pstats.Stats(os.path.join(self.directory, name + ".prof")))
+            except (ValueError, OSError, TypeError, EOFError):
+                continue  # not one of ours, or only the .folded half survived
+            seeded.append({"name": name, "at": at.strftime("%Y-%m-%d %H:%M:%S"), "method": "", "route": slug,
+                           "path": "", "ms": elapsed, "top": top})
+        with self._lock:
+            if not self._seeded:
+                known = {s["name"] for s in self.samples}
+                self.samples = [s for s in seeded if s["name"] not in known] + self.samples
+                self._seeded = True
+
+    def _sample_stacks(self) -> None:
+        while True:
+            with self._lock:
+                if not self._active:
+                    self._sampler = None
+                    return
+                idents = list(self._active)
+            frames = sys._current_frames()
+            for ident in idents:
+                frame, stack = frames.get(ident), []
+                while frame is not None:
+                    stack.append(f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_code.co_name}")
+                    frame = frame.f_back
+                if stack:
+                    with self._lock:
+                        counter = self._active.get(ident)
+                        if counter is not None:
+                            counter[";".join(reversed(stack))] += 1
+            time.sleep(self.interval)
+
+profiler = RequestProfiler(parse_profile_rates(os.environ.get("PROFILE_SAMPLE", "")),
+                           os.environ.get("PROFILE_DIR", "profiles"),
+                           int(os.environ.get("PROFILE_KEEP", "200")),
+                           float(os.environ.get("PROFILE_INTERVAL_MS", "2")) / 1000.0)
+
+@app.before_request
+def maybe_start_profile():
+    if not profiler.rates:
+        return
+    rule = request.url_rule.rule if request.url_rule else request.path
+    if random.random() < profiler.rate_for(rule):
+        g.profile = profiler.start()
+
+@app.teardown_request
+def maybe_stop_profile(exception=None):
+    handle = g.pop("profile", None)
+    if handle is not None:
+        profiler.stop(handle, request.method, request.url_rule.rule if request.url_rule else request.path,
+                      request.full_path.rstrip("?"))
 
 # -------------------- Models --------------------
 class Player(Base):
@@ -461,6 +817,10 @@ class Week(Base):
     number = Column(Integer, unique=True, nullable=False)
     room_code = Column(String, nullable=False)
     status = Column(String, default="drafting") # drafting | provisional | finalized
+    version = Column(Integer, nullable=False, default=0, server_default="0")  # bumped on every pick/result write
+    fixtures_version = Column(Integer, nullable=False, default=0, server_default="0")  # bumped by re-init / sync only
+    # Ids are never reused after a season is archived (new DBs; older ones rely on week_version_floor)
+    __table_args__ = {"sqlite_autoincrement": True}
 
 class Fixture(Base):
     __tablename__ = "fixtures"
@@ -469,7 +829,11 @@ class Fixture(Base):
     match_number = Column(Integer, nullable=False)
     home = Column(String, nullable=False)
     away = Column(String, nullable=False)
-    __table_args__ = (UniqueConstraint("week_id", "match_number", name="uix_week_matchnumber"),)
+    kickoff = Column(DateTime, nullable=True, index=True)  # naive UTC; NULL = unknown (never locks)
+    __table_args__ = (
+        UniqueConstraint("week_id", "match_number", name="uix_week_matchnumber"),
+        Index("ix_fixtures_week_kickoff", "week_id", "kickoff"),
+    )
 
 class Matchup(Base):
     __tablename__ = "matchups"
@@ -503,8 +867,458 @@ class Result(Base):
     outcome = Column(String, nullable=False)  # Home|Away|Draw
     fixture = relationship("Fixture")
 
+class Event(Base):
+    """Append-only log of domain events; the id is the event offset consumers resume from."""
+    __tablename__ = "events"
+    id = Column(Integer, primary_key=True)
+    kind = Column(String, nullable=False)  # PickMade | ResultSet | ResultCorrected | WeekReinitialized | ...
+    week_id = Column(Integer, ForeignKey("weeks.id"), nullable=True, index=True)
+    payload = Column(Text, nullable=False)  # JSON
+    created_at = Column(DateTime, default=datetime.utcnow)
+    __table_args__ = {"sqlite_autoincrement": True}  # offsets are never reused
+
+class StandingsSnapshot(Base):
+    __tablename__ = "standings_snapshots"
+    id = Column(Integer, primary_key=True)
+    event_offset = Column(Integer, nullable=False)  # last event id folded into `state`
+    state = Column(Text, nullable=False)  # JSON StandingsProjection state
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+# --- Analytics aggregates (keyed by player name so they survive season archives) ---
+class AnalyticsPair(Base):
+    __tablename__ = "analytics_h2h"
+    player = Column(String, primary_key=True)
+    opponent = Column(String, primary_key=True)
+    played = Column(Integer, nullable=False, default=0)
+    wins = Column(Integer, nullable=False, default=0)
+    losses = Column(Integer, nullable=False, default=0)
+    draws = Column(Integer, nullable=False, default=0)
+    points_for = Column(Integer, nullable=False, default=0)
+    points_against = Column(Integer, nullable=False, default=0)
+
+class AnalyticsTeam(Base):
+    __tablename__ = "analytics_team"
+    player = Column(String, primary_key=True)
+    team = Column(String, primary_key=True)
+    picks = Column(Integer, nullable=False, default=0)
+    wins = Column(Integer, nullable=False, default=0)
+    losses = Column(Integer, nullable=False, default=0)
+    draws = Column(Integer, nullable=False, default=0)
+
+class AnalyticsSide(Base):
+    __tablename__ = "analytics_side"
+    player = Column(String, primary_key=True)
+    side = Column(String, primary_key=True)  # Home | Away
+    picks = Column(Integer, nullable=False, default=0)
+    wins = Column(Integer, nullable=False, default=0)
+    losses = Column(Integer, nullable=False, default=0)
+    draws = Column(Integer, nullable=False, default=0)
+
+class AnalyticsWeek(Base):
+    """What one live week currently contributes to the aggregates (so it can be subtracted)."""
+    __tablename__ = "analytics_weeks"
+    week_id = Column(Integer, ForeignKey("weeks.id"), primary_key=True)
+    contribution = Column(Text, nullable=False)  # JSON {"pair": [...], "team": [...], "side": [...]}
+
 Base.metadata.create_all(engine)
 
+def ensure_schema() -> None:
+    """Add columns/indexes introduced after a DB was first created (create_all won't alter tables)."""
+    cols = {c["name"] for c in inspect(engine).get_columns("fixtures")}
+    week_cols = {c["name"] for c in inspect(engine).get_columns("weeks")}
+    with engine.begin() as conn:
+        if "kickoff" not in cols:
+            conn.execute(text("ALTER TABLE fixtures ADD COLUMN kickoff DATETIME"))
+        if "version" not in week_cols:
+            conn.execute(text("ALTER TABLE weeks ADD COLUMN version INTEGER NOT NULL DEFAULT 0"))
+        if "fixtures_version" not in week_cols:
+            conn.execute(text("ALTER TABLE weeks ADD COLUMN fixtures_version INTEGER NOT NULL DEFAULT 0"))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_fixtures_kickoff ON fixtures (kickoff)"))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_fixtures_week_kickoff ON fixtures (week_id, kickoff)"))
+
+ensure_schema()
+
+# -------------------- Rendered-fragment cache --------------------
+class FragmentCache:
+    """Bounded LRU of rendered HTML fragments.
+
+    Keys are (template, week_id, data version..., viewer bits...). Week versions make stale
+    entries unreachable across processes; explicit invalidation frees them in this one.
+    A week_id of None marks a fragment that depends on every week (e.g. the season tab).
+    Templates in FIXTURE_TEMPLATES only depend on fixture rows and survive pick/result writes.
+    """
+    FIXTURE_TEMPLATES = ("fixtures",)
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[tuple, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def get_or_render(self, key: tuple, render: Callable[[], str]) -> str:
+        with self._lock:
+            html = self._data.get(key)
+            if html is not None:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return html
+            self.misses += 1
+        html = render()
+        with self._lock:
+            self._data[key] = html
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+        return html
+
+    def invalidate_weeks(self, week_ids: Iterable[int], fixture_week_ids: Iterable[int] = ()) -> None:
+        ids, fixture_ids = set(week_ids), set(fixture_week_ids)
+        with self._lock:
+            stale = [k for k in self._data if k[1] is None or k[1] in ids and (
+                k[0] not in self.FIXTURE_TEMPLATES or k[1] in fixture_ids)]
+            for k in stale:
+                del self._data[k]
+            self.invalidations += len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.invalidations += len(self._data)
+            self._data.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {"size": len(self._data), "maxsize": self.maxsize, "hits": self.hits,
+                    "misses": self.misses, "hit_rate": round(self.hits / total, 3) if total else 0.0,
+                    "evictions": self.evictions, "invalidations": self.invalidations}
+
+fragment_cache = FragmentCache(int(os.environ.get("FRAGMENT_CACHE_SIZE", "256")))
+
+def bump_week_versions(db, week_ids: Iterable[int], fixtures: bool = False) -> None:
+    """Bump data versions in the current transaction; cached fragments are dropped on commit.
+
+    fixtures=True also bumps fixtures_version (fixture rows themselves changed).
+    """
+    ids = set(week_ids)
+    if not ids:
+        return
+    values = {Week.version: Week.version + 1}
+    if fixtures:
+        values[Week.fixtures_version] = Week.fixtures_version + 1
+    db.query(Week).filter(Week.id.in_(ids)).update(values, synchronize_session=False)
+    db.info.setdefault("changed_weeks", set()).update(ids)
+    if fixtures:
+        db.info.setdefault("changed_fixtures", set()).update(ids)
+
+@event.listens_for(SessionFactory, "after_commit")
+def invalidate_fragments_on_commit(db):
+    ids = db.info.pop("changed_weeks", None)
+    fixture_ids = db.info.pop("changed_fixtures", ())
+    if ids:
+        fragment_cache.invalidate_weeks(ids, fixture_ids)
+
+@event.listens_for(SessionFactory, "after_rollback")
+def forget_changes_on_rollback(db):
+    db.info.pop("changed_weeks", None)
+    db.info.pop("changed_fixtures", None)
+
+# -------------------- Event log + standings projection --------------------
+SNAPSHOT_EVERY = int(os.environ.get("SNAPSHOT_EVERY", "200"))               # events between snapshots
+SNAPSHOT_INTERVAL = int(os.environ.get("SNAPSHOT_INTERVAL_SECONDS", "300"))  # how often to check
+
+def record_event(db, kind: str, week_id: Optional[int], **payload) -> None:
+    """Append an event in the caller's transaction; subscribers are woken on commit."""
+    db.add(Event(kind=kind, week_id=week_id, payload=_json_encoder.encode(payload).decode()))
+    db.info["events_added"] = True
+
+def events_since(db, offset: int, limit: int = 500) -> List[dict]:
+    rows = db.query(Event).filter(Event.id > offset).order_by(Event.id.asc()).limit(limit).all()
+    return [{"offset": e.id, "kind": e.kind, "week_id": e.week_id, "at": e.created_at,
+             "payload": msgspec.json.decode(e.payload)} for e in rows]
+
+class EventFeed:
+    """Wakes in-process subscribers (SSE streams) when new events are committed."""
+
+    def __init__(self):
+        self._cv = threading.Condition()
+        self._generation = 0
+
+    def notify(self) -> None:
+        with self._cv:
+            self._generation += 1
+            self._cv.notify_all()
+
+    def wait(self, generation: int, timeout: float) -> int:
+        with self._cv:
+            self._cv.wait_for(lambda: self._generation != generation, timeout=timeout)
+            return self._generation
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+event_feed = EventFeed()
+
+@event.listens_for(SessionFactory, "after_commit")
+def notify_event_subscribers(db):
+    if db.info.pop("events_added", False):
+        event_feed.notify()
+
+@event.listens_for(SessionFactory, "after_rollback")
+def forget_events_on_rollback(db):
+    db.info.pop("events_added", None)
+
+class StandingsProjection:
+    """Season standings folded from the event log.
+
+    State per week: fixture count, matchup pairs, picks per fixture as (player, side) and
+    results. A week counts toward standings once every fixture has a result, mirroring
+    update_week_status' "finalized".
+    """
+
+    def __init__(self, state: Optional[dict] = None, offset: int = 0):
+        self.weeks: Dict[str, dict] = (state or {}).get("weeks", {})
+        self.offset = offset
+        self.archives_seen = 0
+
+    def apply(self, offset: int, kind: str, week_id: Optional[int], payload: dict) -> None:
+        if kind == "SeasonArchived":
+            self.weeks = {}
+            self.archives_seen += 1
+        elif kind == "WeekReinitialized":
+            self.weeks[str(week_id)] = {"fixtures": payload["fixtures"], "matchups": payload["matchups"],
+                                        "picks": {}, "results": {}}
+        elif kind == "PickMade":
+            wk = self.weeks.get(str(week_id))
+            if wk is not None:
+                wk["picks"].setdefault(str(payload["fixture_id"]), []).append(
+                    [payload["player_id"], payload["side"]])
+        elif kind in ("ResultSet", "ResultCorrected"):
+            wk = self.weeks.get(str(week_id))
+            if wk is not None:
+                wk["results"][str(payload["fixture_id"])] = payload["outcome"]
+        elif kind == "FixturesSynced":
+            wk = self.weeks.get(str(week_id))
+            if wk is not None:
+                wk["fixtures"] = payload["fixtures"]
+                for fid in payload["removed"]:
+                    wk["picks"].pop(str(fid), None)
+                    wk["results"].pop(str(fid), None)
+                for fid, fx in payload["touched"].items():
+                    wk["picks"][fid] = fx["picks"]
+                    if fx["result"] is None:
+                        wk["results"].pop(fid, None)
+                    else:
+                        wk["results"][fid] = fx["result"]
+        self.offset = offset
+
+    def catch_up(self, db) -> None:
+        while True:
+            batch = events_since(db, self.offset)
+            if not batch:
+                return
+            for e in batch:
+                self.apply(e["offset"], e["kind"], e["week_id"], e["payload"])
+
+    @staticmethod
+    def week_points(wk: dict) -> Dict[int, int]:
+        points: Dict[int, int] = {}
+        for fid, outcome in wk["results"].items():
+            for pid, side in wk["picks"].get(fid, []):
+                delta = 0 if outcome == "Draw" else (1 if side == outcome else -1)
+                points[pid] = points.get(pid, 0) + delta
+        return points
+
+    def totals(self) -> Dict[int, Dict[str, int]]:
+        totals: Dict[int, Dict[str, int]] = {}
+        for wk in self.weeks.values():
+            done = len(wk["results"])
+            if done == 0 or done < wk["fixtures"]:
+                continue
+            points = self.week_points(wk)
+            for _, a, b in wk["matchups"]:
+                pa = points.get(a, 0); pb = points.get(b, 0)
+                for pid, f, ag in ((a, pa, pb), (b, pb, pa)):
+                    row = totals.setdefault(pid, {"for": 0, "against": 0, "net": 0})
+                    row["for"] += f; row["against"] += ag
+        for vals in totals.values():
+            vals["net"] = vals["for"] - vals["against"]
+        return totals
+
+    def state(self) -> dict:
+        return {"weeks": self.weeks}
+
+def projection_state_from_tables(db) -> dict:
+    """Projection state built from the live tables (used to seed the first snapshot)."""
+    weeks: Dict[str, dict] = {}
+    for wk in db.query(Week).all():
+        fixtures = {f.id: f for f in db.query(Fixture).filter_by(week_id=wk.id)}
+        state = {"fixtures": len(fixtures), "picks": {}, "results": {},
+                 "matchups": [[m.id, m.player_a_id, m.player_b_id]
+                              for m in db.query(Matchup).filter_by(week_id=wk.id).order_by(Matchup.id.asc())]}
+        for p in db.query(Pick).join(Matchup).filter(Matchup.week_id==wk.id).order_by(Pick.id.asc()):
+            side = "Home" if p.team == fixtures[p.fixture_id].home else "Away"
+            state["picks"].setdefault(str(p.fixture_id), []).append([p.player_id, side])
+        for r in db.query(Result).filter(Result.fixture_id.in_(fixtures)):
+            state["results"][str(r.fixture_id)] = r.outcome
+        weeks[str(wk.id)] = state
+    return {"weeks": weeks}
+
+def latest_event_offset(db) -> int:
+    return db.query(Event.id).order_by(Event.id.desc()).limit(1).scalar() or 0
+
+def rebuild_standings(db) -> StandingsProjection:
+    """Latest snapshot + event tail. With no snapshot yet, seed one from the live tables."""
+    snap = db.query(StandingsSnapshot).order_by(StandingsSnapshot.event_offset.desc()).first()
+    if snap is None:
+        # Tables and offset must come from one read transaction to agree with each other
+        proj = read_consistently(
+            lambda rdb: StandingsProjection(projection_state_from_tables(rdb), latest_event_offset(rdb)))
+        writer.submit(lambda wdb: take_standings_snapshot(wdb, proj))
+    else:
+        proj = StandingsProjection(msgspec.json.decode(snap.state), snap.event_offset)
+    proj.catch_up(db)
+    return proj
+
+def take_standings_snapshot(db, proj: StandingsProjection) -> int:
+    """Add a snapshot of `proj` (no commit; run it as a writer job)."""
+    db.add(StandingsSnapshot(event_offset=proj.offset, state=_json_encoder.encode(proj.state()).decode()))
+    return proj.offset
+
+_standings_lock = threading.Lock()
+_standings: Optional[StandingsProjection] = None
+
+def season_standings(db) -> Dict[int, Dict[str, int]]:
+    """Hot per-process projection: only events newer than its offset are read per call."""
+    global _standings
+    with _standings_lock:
+        if _standings is None:
+            _standings = rebuild_standings(db)
+        else:
+            seen = _standings.archives_seen
+            _standings.catch_up(db)
+            if _standings.archives_seen != seen:  # another process archived the season
+                fragment_cache.clear()
+                week_states.clear()
+        return _standings.totals()
+
+def standings_snapshot_job() -> None:
+    """Recurring: snapshot when the tail since the last snapshot has grown past SNAPSHOT_EVERY."""
+    db = SessionLocal()
+    try:
+        last = db.query(StandingsSnapshot.event_offset).order_by(StandingsSnapshot.event_offset.desc()).limit(1).scalar()
+        if last is None:
+            rebuild_standings(db)  # seeds the first snapshot itself
+        elif latest_event_offset(db) - last >= SNAPSHOT_EVERY:
+            proj = rebuild_standings(db)
+            writer.submit(lambda wdb: take_standings_snapshot(wdb, proj))
+    finally:
+        SessionLocal.remove()
+        scheduler.schedule_in(SNAPSHOT_INTERVAL, standings_snapshot_job)
+
+# -------------------- Write coordinator --------------------
+WRITE_QUEUE = os.environ.get("WRITE_QUEUE", "1") == "1"  # 0 = each request writes on its own
+WRITE_BATCH_MAX = int(os.environ.get("WRITE_BATCH_MAX", "64"))
+WRITE_BATCH_WINDOW = float(os.environ.get("WRITE_BATCH_WINDOW_MS", "0")) / 1000.0
+
+class WriteCoordinator:
+    """Runs every DB mutation on one writer thread and commits concurrent ones together.
+
+    A job is fn(db) -> result doing its reads, checks and writes without committing. The
+    writer drains whatever is queued (optionally waiting WRITE_BATCH_WINDOW for more),
+    opens one BEGIN IMMEDIATE transaction, runs each job inside its own SAVEPOINT so a
+    rejected job (e.g. abort(400)) only undoes itself, then commits once. Each caller gets
+    its own result or exception back.
+    """
+
+    def __init__(self, max_batch: int, window: float):
+        self.max_batch = max_batch
+        self.window = window
+        self._queue: "queue.Queue[tuple]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self.batches = self.jobs = 0
+
+    def submit(self, fn: Callable):
+        if not WRITE_QUEUE or threading.current_thread() is self._thread:
+            result = self._run_inline(fn)
+        else:
+            self._ensure_started()
+            fut: Future = Future()
+            self._queue.put((fn, fut))
+            result = fut.result()
+        SessionLocal.rollback()  # drop the caller's cached rows so it reads its own write
+        return result
+
+    def _run_inline(self, fn: Callable):
+        db = SessionFactory()
+        try:
+            result = fn(db)
+            db.commit()
+            return result
+        except BaseException:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _ensure_started(self) -> None:
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="db-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.window
+            while len(batch) < self.max_batch:
+                try:
+                    remaining = deadline - time.monotonic()
+                    batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._commit_batch(batch)
+
+    def _commit_batch(self, batch: List[tuple]) -> None:
+        db = SessionFactory()
+        outcomes = []
+        try:
+            db.connection().exec_driver_sql("BEGIN IMMEDIATE")
+            for fn, fut in batch:
+                savepoint = db.begin_nested()
+                try:
+                    result = fn(db)
+                    db.flush()
+                    savepoint.commit()
+                    outcomes.append((fut, result, None))
+                except Exception as e:
+                    savepoint.rollback()
+                    outcomes.append((fut, None, e))
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            for _, fut in batch:
+                fut.set_exception(e)
+            return
+        finally:
+            db.close()
+        self.batches += 1
+        self.jobs += len(batch)
+        for fut, result, error in outcomes:
+            if error is not None:
+                fut.set_exception(error)
+            else:
+                fut.set_result(result)
+
+    def stats(self) -> dict:
+        return {"enabled": WRITE_QUEUE, "batches": self.batches, "jobs": self.jobs,
+                "avg_batch": round(self.jobs / self.batches, 2) if self.batches else 0.0,
+                "queued": self._queue.qsize()}
+
+writer = WriteCoordinator(WRITE_BATCH_MAX, WRITE_BATCH_WINDOW)
+
 # -------------------- Helpers --------------------
 def current_player(db):
     name = session.get("player_name")
@@ -518,73 +1332,132 @@ def matchup_order(m: Matchup) -> Tuple[int, int]:
     return first, second
 
 def compute_next_turn(db, m: Matchup) -> int:
-    picks = db.query(Pick).filter_by(matchup_id=m.id).order_by(Pick.created_at.asc(), Pick.id.asc()).all()
-    count = len(picks)
+    count = db.query(Pick).filter_by(matchup_id=m.id).count()
+    return turn_after(m, count)
+
+def turn_after(m: Matchup, count: int) -> int:
+    """Snake order: first, second, second, first, first, second, ... after `count` picks."""
     first, second = matchup_order(m)
     chunk = count // 2
     order = [first, second] if chunk % 2 == 0 else [second, first]
     return order[count % 2]
 
+# Kickoff lock: picks close when a fixture starts. KICKOFF_LOCK=0 disables it (e.g. replaying an old season).
+KICKOFF_LOCK = os.environ.get("KICKOFF_LOCK", "1") == "1"
+# Timezone of the CSV "Date" column; stored kickoffs are naive UTC like Pick.created_at
+FIXTURES_TZ = ZoneInfo(os.environ.get("FIXTURES_TZ", "Europe/London"))
+
+def parse_kickoff(raw) -> Optional[datetime]:
+    """Parse a CSV 'DD/MM/YYYY HH:MM' local kickoff into naive UTC (None if blank/unparseable)."""
+    if raw is None or (isinstance(raw, float) and pd.isna(raw)):
+        return None
+    try:
+        local = datetime.strptime(str(raw).strip(), "%d/%m/%Y %H:%M")
+    except ValueError:
+        return None
+    return local.replace(tzinfo=FIXTURES_TZ).astimezone(timezone.utc).replace(tzinfo=None)
+
+def not_started_filter(now: Optional[datetime] = None):
+    """SQL filter for fixtures still open for picks (uses the (week_id, kickoff) index)."""
+    if not KICKOFF_LOCK:
+        return text("1=1")
+    now = now or datetime.utcnow()
+    return or_(Fixture.kickoff.is_(None), Fixture.kickoff > now)
+
+def fixture_started(fx: Fixture, now: Optional[datetime] = None) -> bool:
+    if not KICKOFF_LOCK or fx.kickoff is None:
+        return False
+    return fx.kickoff <= (now or datetime.utcnow())
+
 def available_fixtures_for_matchup(db, m: Matchup) -> list:
     picked_fixture_ids = [p.fixture_id for p in db.query(Pick.fixture_id).filter_by(matchup_id=m.id).all()]
-    fixtures = db.query(Fixture).filter_by(week_id=m.week_id).order_by(Fixture.match_number.asc()).all()
+    fixtures = (db.query(Fixture)
+                .filter(Fixture.week_id == m.week_id, not_started_filter())
+                .order_by(Fixture.match_number.asc()).all())
     return [f for f in fixtures if f.id not in picked_fixture_ids]
 
-def weekly_points_map(db, week: Week) -> Dict[int, int]:
-    players = {p.id: 0 for p in db.query(Player).all()}
-    results = {r.fixture_id: r.outcome for r in db.query(Result).join(Fixture).filter(Fixture.week_id==week.id)}
-    for p in db.query(Pick).join(Matchup).filter(Matchup.week_id==week.id):
-        fx = p.fixture
-        outcome = results.get(fx.id)
-        if outcome is None:
-            continue
-        if outcome == "Draw":
-            delta = 0
-        elif outcome == "Home":
-            delta = 1 if p.team == fx.home else -1
-        else:
-            delta = 1 if p.team == fx.away else -1
-        players[p.player_id] = players.get(p.player_id, 0) + delta
-    return players
-
-def weekly_for_against(db, week: Week) -> Dict[int, Dict[str,int]]:
-    points = weekly_points_map(db, week)
-    out: Dict[int, Dict[str,int]] = {pid: {'for': 0, 'against': 0} for pid in points.keys()}
-    for m in db.query(Matchup).filter_by(week_id=week.id).all():
-        pa = points.get(m.player_a_id, 0); pb = points.get(m.player_b_id, 0)
-        out[m.player_a_id]['for'] += pa; out[m.player_a_id]['against'] += pb
-        out[m.player_b_id]['for'] += pb; out[m.player_b_id]['against'] += pa
+def pick_delta(team: str, fx: Fixture, outcome: str) -> int:
+    """+1 for picking the winner, -1 for the loser, 0 on a draw."""
+    if outcome == "Draw":
+        return 0
+    if outcome == "Home":
+        return 1 if team == fx.home else -1
+    return 1 if team == fx.away else -1
+
+def weekly_points_for_weeks(db, weeks: List[Week]) -> Dict[int, Dict[int, int]]:
+    """Points per player for several weeks with one pick/result query: {week_id: {player_id: points}}."""
+    player_ids = [pid for (pid,) in db.query(Player.id)]
+    out = {wk.id: dict.fromkeys(player_ids, 0) for wk in weeks}
+    rows = (db.query(Matchup.week_id, Pick.player_id, Pick.team, Fixture.home, Fixture.away, Result.outcome)
+            .join(Pick, Pick.matchup_id == Matchup.id)
+            .join(Fixture, Fixture.id == Pick.fixture_id)
+            .join(Result, Result.fixture_id == Fixture.id)
+            .filter(Matchup.week_id.in_(list(out))))
+    for week_id, player_id, team, home, away, outcome in rows:
+        points = out[week_id]
+        if outcome != "Draw":
+            points[player_id] = points.get(player_id, 0) + (1 if team == (home if outcome == "Home" else away) else -1)
     return out
 
-def season_totals_finalized(db) -> Dict[int, Dict[str,int]]:
-    totals: Dict[int, Dict[str,int]] = {}
-    for wk in db.query(Week).order_by(Week.number.asc()).all():
-        if wk.status != "finalized":
-            continue
-        fa = weekly_for_against(db, wk)
-        for pid, vals in fa.items():
-            if pid not in totals:
-                totals[pid] = {'for': 0, 'against': 0, 'net': 0}
-            totals[pid]['for'] += vals['for']
-            totals[pid]['against'] += vals['against']
-    for pid, vals in totals.items():
-        vals['net'] = vals['for'] - vals['against']
-    return totals
-
 def count_results_for_week(db, wk: Week) -> Tuple[int,int]:
     total = db.query(Fixture).filter_by(week_id=wk.id).count()
     done = db.query(Result).join(Fixture).filter(Fixture.week_id==wk.id).count()
     return done, total
 
-def update_week_status(db, wk: Week) -> None:
+def week_status_for(db, wk: Week) -> str:
     done, total = count_results_for_week(db, wk)
     if done == 0:
-        wk.status = "drafting"
-    elif done < total:
-        wk.status = "provisional"
-    else:
-        wk.status = "finalized"
-    db.add(wk); db.commit()
+        return "drafting"
+    if done < total:
+        return "provisional"
+    return "finalized"
+
+def update_week_status(db, wk: Week, commit: bool = True) -> None:
+    status = week_status_for(db, wk)
+    if status == "finalized" and wk.status != "finalized":
+        db.info["week_finalized"] = True  # fresh read snapshot once this commits
+    wk.status = status
+    db.add(wk)
+    if commit:
+        db.commit()
+
+def sync_week_status(db, wk: Week) -> None:
+    """Read-path status refresh: only queues a write when the stored status is stale."""
+    if week_status_for(db, wk) != wk.status:
+        week_id = wk.id
+        writer.submit(lambda wdb: update_week_status(wdb, wdb.get(Week, week_id), commit=False))
+
+def canonical_outcome(fx: Fixture, raw: str) -> Optional[str]:
+    """Map a team name / 'Draw' onto the stored Home|Away|Draw value (None if invalid)."""
+    raw = (raw or "").strip()
+    if raw.lower() == "draw":
+        return "Draw"
+    if raw == fx.home:
+        return "Home"
+    if raw == fx.away:
+        return "Away"
+    return None
+
+def upsert_results(db, outcomes: Dict[int, str]) -> None:
+    """Write {fixture_id: outcome} as one INSERT .. ON CONFLICT DO UPDATE batch (no commit)."""
+    if not outcomes:
+        return
+    week_of = dict(db.query(Fixture.id, Fixture.week_id).filter(Fixture.id.in_(outcomes)))
+    previous = dict(db.query(Result.fixture_id, Result.outcome).filter(Result.fixture_id.in_(outcomes)))
+    bump_week_versions(db, set(week_of.values()))
+    for fid, oc in outcomes.items():
+        if fid not in previous:
+            record_event(db, "ResultSet", week_of.get(fid), fixture_id=fid, outcome=oc)
+        elif previous[fid] != oc:
+            record_event(db, "ResultCorrected", week_of.get(fid), fixture_id=fid, outcome=oc,
+                         previous=previous[fid])
+    stmt = sqlite_insert(Result.__table__).values(
+        [{"fixture_id": fid, "outcome": oc} for fid, oc in outcomes.items()]
+    )
+    stmt = stmt.on_conflict_do_update(index_elements=["fixture_id"],
+                                      set_={"outcome": stmt.excluded.outcome})
+    db.execute(stmt)
+    refresh_week_analytics(db, set(week_of.values()))
 
 def current_drafting_week(db) -> Optional[Week]:
     wk = db.query(Week).filter_by(status="drafting").order_by(Week.number.asc()).first()
@@ -593,6 +1466,239 @@ def current_drafting_week(db) -> Optional[Week]:
     if wk: return wk
     return db.query(Week).order_by(Week.number.asc()).first()
 
+# -------------------- View loaders (shared by HTML partials + JSON API) --------------------
+class PlayerRec:
+    __slots__ = ("id", "name")
+
+    def __init__(self, id: int, name: str):
+        self.id = id; self.name = name
+
+class FixtureRec:
+    __slots__ = ("id", "match_number", "home", "away", "kickoff")
+
+    def __init__(self, id: int, match_number: int, home: str, away: str, kickoff: Optional[datetime]):
+        self.id = id; self.match_number = match_number; self.home = home; self.away = away
+        self.kickoff = kickoff
+
+class MatchupRec:
+    __slots__ = ("id", "week_id", "player_a_id", "player_b_id", "first_picker_id")
+
+    def __init__(self, id: int, week_id: int, player_a_id: int, player_b_id: int, first_picker_id: int):
+        self.id = id; self.week_id = week_id
+        self.player_a_id = player_a_id; self.player_b_id = player_b_id; self.first_picker_id = first_picker_id
+
+class PickRec:
+    __slots__ = ("id", "matchup_id", "player_id", "fixture_id", "team", "created_at")
+
+    def __init__(self, id: int, matchup_id: int, player_id: int, fixture_id: int, team: str, created_at: datetime):
+        self.id = id; self.matchup_id = matchup_id; self.player_id = player_id
+        self.fixture_id = fixture_id; self.team = team; self.created_at = created_at
+
+class WeekState:
+    """A week's players, fixtures, results, matchups and picks as plain slotted records.
+
+    Loaded with column queries (no ORM identity map) once per (week, version) and shared by
+    every fragment, the JSON API and payouts. Records duck-type the ORM attributes the view
+    code reads, so turn_after / pick_delta / fixture_started accept either. The version is
+    read first, from `db`, so it labels exactly the rows that follow when `db` reads in one
+    transaction (see read_consistently).
+    """
+    __slots__ = ("week_id", "version", "players", "fixtures", "fixtures_by_id", "results",
+                 "matchups", "picks_by_matchup")
+
+    def __init__(self, db, wk: Week):
+        self.week_id = wk.id
+        self.version = db.query(Week.version).filter(Week.id == wk.id).scalar()
+        self.players = {pid: PlayerRec(pid, name) for pid, name in db.query(Player.id, Player.name)}
+        self.fixtures = [FixtureRec(*row) for row in
+                         db.query(Fixture.id, Fixture.match_number, Fixture.home, Fixture.away, Fixture.kickoff)
+                         .filter(Fixture.week_id == wk.id).order_by(Fixture.match_number.asc())]
+        self.fixtures_by_id = {f.id: f for f in self.fixtures}
+        self.results = dict(db.query(Result.fixture_id, Result.outcome).join(Fixture)
+                            .filter(Fixture.week_id == wk.id))
+        self.matchups = [MatchupRec(*row) for row in
+                         db.query(Matchup.id, Matchup.week_id, Matchup.player_a_id, Matchup.player_b_id,
+                                  Matchup.first_picker_id)
+                         .filter(Matchup.week_id == wk.id).order_by(Matchup.id.asc())]
+        self.picks_by_matchup: Dict[int, List[PickRec]] = {m.id: [] for m in self.matchups}
+        for row in (db.query(Pick.id, Pick.matchup_id, Pick.player_id, Pick.fixture_id, Pick.team, Pick.created_at)
+                    .join(Matchup).filter(Matchup.week_id == wk.id)
+                    .order_by(Pick.created_at.asc(), Pick.id.asc())):
+            self.picks_by_matchup.setdefault(row.matchup_id, []).append(PickRec(*row))
+
+    def points(self) -> Dict[int, int]:
+        points = {pid: 0 for pid in self.players}
+        for picks in self.picks_by_matchup.values():
+            for p in picks:
+                outcome = self.results.get(p.fixture_id)
+                if outcome is not None:
+                    points[p.player_id] = points.get(p.player_id, 0) + pick_delta(
+                        p.team, self.fixtures_by_id[p.fixture_id], outcome)
+        return points
+
+class WeekStateCache:
+    """Bounded LRU of WeekState per week, kept hot across requests in this process.
+
+    A lookup reloads whenever the Week row's version moved (another process wrote, or a
+    write this process didn't apply). make_pick / set_result patch the cached state in place
+    when it is exactly one version behind their write (re-adding a pick a reload already
+    holds is a no-op); anything else drops it.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[int, WeekState]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.patches = 0
+
+    def get(self, wk: Week) -> WeekState:
+        with self._lock:
+            state = self._data.get(wk.id)
+            if state is not None and state.version == wk.version:
+                self._data.move_to_end(wk.id)
+                self.hits += 1
+                return state
+            self.misses += 1
+        state = read_consistently(lambda rdb: WeekState(rdb, wk))
+        with self._lock:
+            current = self._data.get(wk.id)
+            if current is None or current.version <= state.version:
+                self._data[wk.id] = state
+                self._data.move_to_end(wk.id)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return state
+
+    def _patch(self, week_id: int, version: int, apply: Callable[[WeekState], None]) -> None:
+        with self._lock:
+            state = self._data.get(week_id)
+            if state is None:
+                return
+            if state.version != version - 1:
+                if state.version < version:
+                    del self._data[week_id]
+                return
+            apply(state)
+            state.version = version
+            self.patches += 1
+
+    def add_pick(self, week_id: int, version: int, pick: PickRec) -> None:
+        def apply(st: WeekState) -> None:
+            picks = st.picks_by_matchup.setdefault(pick.matchup_id, [])
+            if all(p.id != pick.id for p in picks):  # a reload may already hold it
+                picks.append(pick)
+        self._patch(week_id, version, apply)
+
+    def set_result(self, week_id: int, version: int, fixture_id: int, outcome: str) -> None:
+        self._patch(week_id, version, lambda st: st.results.__setitem__(fixture_id, outcome))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"size": len(self._data), "maxsize": self.maxsize, "hits": self.hits,
+                    "misses": self.misses, "patches": self.patches}
+
+week_states = WeekStateCache(int(os.environ.get("WEEK_STATE_CACHE_SIZE", "16")))
+
+def load_matchups_view(db, wk: Week, data: Optional[WeekState] = None) -> List[dict]:
+    """Matchups for a week with turn, still-available fixtures and pick log."""
+    data = data or week_states.get(wk)
+    now = datetime.utcnow()
+    matchups = []
+    for m in data.matchups:
+        picks = data.picks_by_matchup.get(m.id, [])
+        turn_id = turn_after(m, len(picks))
+        picked = {p.fixture_id for p in picks}
+        avail_view = [{"id": f.id, "match_number": f.match_number, "home": f.home, "away": f.away,
+                       "kickoff": f.kickoff}
+                      for f in data.fixtures if f.id not in picked and not fixture_started(f, now)]
+        log = []
+        for p in picks:
+            fx = data.fixtures_by_id[p.fixture_id]
+            log.append({
+                "player": data.players[p.player_id].name,
+                "match_number": fx.match_number,
+                "home": fx.home,
+                "away": fx.away,
+                "team": p.team,
+                "when": p.created_at.strftime("%H:%M:%S"),
+                "at": p.created_at,
+            })
+        matchups.append({
+            "id": m.id,
+            "a": data.players[m.player_a_id].name,
+            "b": data.players[m.player_b_id].name,
+            "first": data.players[m.first_picker_id].name,
+            "turn_id": turn_id,
+            "turn_name": data.players[turn_id].name,
+            "available": avail_view,
+            "log": log
+        })
+    return matchups
+
+def outcome_display(fx, outcome: Optional[str]) -> str:
+    if outcome == "Home":
+        return fx.home
+    if outcome == "Away":
+        return fx.away
+    if outcome == "Draw":
+        return "Draw"
+    return "—"
+
+def load_scores_view(db, wk: Week, data: Optional[WeekState] = None) -> dict:
+    """Player points, payouts and per-fixture results for a week."""
+    data = data or week_states.get(wk)
+    points = data.points()
+    scores = [{"name": pl.name, "points": points.get(pl.id, 0)} for pl in data.players.values()]
+    payouts = payouts_for_week(db, wk, data)
+    fixtures_view = []
+    fixtures_with_results = []
+    for f in data.fixtures:
+        outcome = data.results.get(f.id)
+        fixtures_view.append({"id": f.id, "match_number": f.match_number, "home": f.home, "away": f.away})
+        fixtures_with_results.append({
+            "match_number": f.match_number,
+            "home": f.home,
+            "away": f.away,
+            "outcome": outcome,
+            "outcome_display": outcome_display(f, outcome)
+        })
+    return {"scores": scores, "payouts": payouts, "fixtures": fixtures_view,
+            "fixtures_with_results": fixtures_with_results}
+
+SEASON_WINDOW = int(os.environ.get("SEASON_WINDOW", "8"))  # weeks per rollup page
+
+def load_season_totals(db, totals: Optional[Dict[int, Dict[str, int]]] = None) -> dict:
+    """Finalized-week season totals (from the hot standings projection unless `totals` is given)."""
+    players = db.query(Player).order_by(Player.name.asc()).all()
+    totals = season_standings(db) if totals is None else totals
+    season_rows = []
+    for p in players:
+        season_rows.append({
+            "name": p.name,
+            "for": totals.get(p.id, {}).get("for", 0),
+            "against": totals.get(p.id, {}).get("against", 0),
+            "net": totals.get(p.id, {}).get("net", 0),
+        })
+    return {"season_rows": season_rows, "players": players}
+
+def load_season_weeks(db, weeks: List[Week]) -> Dict[int, Dict[int, int]]:
+    """Per-week points rollup keyed by week number, for just the given weeks."""
+    by_id = weekly_points_for_weeks(db, weeks)
+    return {wk.number: by_id[wk.id] for wk in weeks}
+
+def load_season_view(db, totals: Optional[Dict[int, Dict[str, int]]] = None) -> dict:
+    """Finalized-week season totals plus the per-week points rollup.
+
+    totals: standings to use instead of the hot projection, which tracks the live DB (a read
+    snapshot passes the ones computed from its own tables).
+    """
+    weeks = db.query(Week).order_by(Week.number.asc()).all()
+    return dict(load_season_totals(db, totals), weeks=weeks, weekly_points=load_season_weeks(db, weeks))
+
 # -------------------- Tab routes (HTMX content) --------------------
 @app.get("/tab/current")
 def tab_current():
@@ -608,8 +1714,8 @@ def tab_current():
         wk = current_drafting_week(db)
     if wk is None:
         return "<div class='card'>No weeks initialized yet.</div>"
-    update_week_status(db, wk)
-    return render_template_string(CURRENT_PARTIAL, current_week=wk, you=you)
+    sync_week_status(db, wk)
+    return render_current(db, wk, you)
 
 @app.get("/tab/open")
 def tab_open():
@@ -659,154 +1765,303 @@ def admin_logout():
 def admin_set_results():
     if not is_admin_session():
         abort(403, "Admin locked")
-    db = SessionLocal()
     wk_number = int(request.form["week"])
-    wk = db.query(Week).filter_by(number=wk_number).first()
-    if not wk:
-        abort(404, "Week not found")
+    form = request.form.to_dict()
 
-    fixtures = db.query(Fixture).filter_by(week_id=wk.id).all()
-    # Apply changes fixture-by-fixture
-    for f in fixtures:
-        key = f"outcome_{f.id}"
-        raw = request.form.get(key, "").strip()
-        if not raw:
-            continue  # no change
-        # Map team-name/Draw into canonical
-        if raw.lower() == "draw":
-            outcome = "Draw"
-        elif raw == f.home:
-            outcome = "Home"
-        elif raw == f.away:
-            outcome = "Away"
-        else:
-            continue  # ignore invalid values
-        existing = db.query(Result).filter_by(fixture_id=f.id).first()
-        if existing:
-            existing.outcome = outcome
-        else:
-            db.add(Result(fixture_id=f.id, outcome=outcome))
+    def write(wdb):
+        wk = wdb.query(Week).filter_by(number=wk_number).first()
+        if not wk:
+            abort(404, "Week not found")
+
+        fixtures = wdb.query(Fixture).filter_by(week_id=wk.id).all()
+        # Collect changes, then write them in one batch
+        outcomes: Dict[int, str] = {}
+        for f in fixtures:
+            raw = form.get(f"outcome_{f.id}", "").strip()
+            if not raw:
+                continue  # no change
+            outcome = canonical_outcome(f, raw)
+            if outcome is None:
+                continue  # ignore invalid values
+            outcomes[f.id] = outcome
+        upsert_results(wdb, outcomes)
+
+        # Optional: force status back to provisional, useful after correcting a finalized week
+        if form.get("force_status") == "provisional":
+            wk.status = "provisional"
+
+        # Recompute status in case everything is filled
+        update_week_status(wdb, wk, commit=False)
+
+    writer.submit(write)
+    return redirect(url_for("admin", week=wk_number))
+
+BULK_OUTCOME_ALIASES = {"home": "Home", "away": "Away", "draw": "Draw"}
+SCORE_RE = re.compile(r"^(\d+)\s*[-:]\s*(\d+)$")  # the fixtures CSV's Result column: "2 - 1"
+
+def score_outcome(raw: str) -> Optional[str]:
+    """'H - A' score -> Home|Away|Draw (None if `raw` isn't a score)."""
+    m = SCORE_RE.match(raw)
+    if m is None:
+        return None
+    home, away = int(m.group(1)), int(m.group(2))
+    return "Home" if home > away else "Away" if away > home else "Draw"
+
+def parse_bulk_results_payload() -> List[Dict[str, str]]:
+    """Read bulk result rows from a JSON body, an uploaded CSV file or a raw CSV body.
+
+    JSON may be a list of rows or {"results": [...]}. CSV headers are matched loosely,
+    so the fixtures CSV itself ("Match Number", "Round Number", "Result") is accepted: its
+    "2 - 1" scores are read as outcomes and its blank (unplayed) rows are skipped.
+    """
+    if request.is_json:
+        data = request.get_json(silent=True)
+        if isinstance(data, dict):
+            data = data.get("results")
+        if not isinstance(data, list):
+            abort(400, "Expected a JSON list of {match_number, outcome} rows")
+        return [r if isinstance(r, dict) else {} for r in data]
+    upload = request.files.get("file")
+    text = upload.read().decode("utf-8-sig") if upload else request.get_data(as_text=True)
+    rows = []
+    for r in csv.DictReader(io.StringIO(text)):
+        norm = {(k or "").strip().lower().replace(" ", "_"): (v or "").strip() for k, v in r.items()}
+        rows.append({
+            "match_number": norm.get("match_number", ""),
+            "outcome": norm.get("outcome", norm.get("result", "")),
+            "week": norm.get("week", norm.get("round_number", "")),
+        })
+    return rows
 
-    # Optional: force status back to provisional, useful after correcting a finalized week
-    if request.form.get("force_status") == "provisional":
-        wk.status = "provisional"
+@app.get("/admin/cache-stats")
+def admin_cache_stats():
+    if not is_admin_session():
+        abort(403, "Admin locked")
+    return jsonify(dict(fragment_cache.stats(), writer=writer.stats(), week_states=week_states.stats(),
+                        read_snapshot=read_snapshots.stats()))
 
-    db.commit()
-    # Recompute status in case everything is filled
-    update_week_status(db, wk)
-    return redirect(url_for("admin", week=wk.number))
+@app.get("/admin/profiles")
+def admin_profiles():
+    if not is_admin_session():
+        abort(403, "Admin locked")
+    rates = ",".join(f"{rule}={rate:g}" for rule, rate in profiler.rates.items())
+    return render_template_string(PROFILES_HTML, samples=profiler.slowest(), rates=rates,
+                                  directory=profiler.directory, keep=profiler.keep)
+
+@app.post("/admin/profiles")
+def admin_profiler_rates():
+    if not is_admin_session():
+        abort(403, "Admin locked")
+    try:
+        profiler.rates = parse_profile_rates(request.form.get("rates", ""))
+    except ValueError:
+        abort(400, "Rates look like '0.05' or '*=0.05,/tab/season=1'")
+    return redirect(url_for("admin_profiles"))
+
+@app.get("/admin/profiles/<name>")
+def admin_profile_file(name: str):
+    if not is_admin_session():
+        abort(403, "Admin locked")
+    return send_from_directory(os.path.abspath(profiler.directory), name, as_attachment=True)
+
+@app.post("/admin/results/bulk")
+def admin_bulk_results():
+    """Upsert many results across any number of weeks in one transaction.
+
+    Rows are {match_number, outcome[, week]}; outcome is a team name, Home, Away, Draw or
+    an "H - A" score, and rows with a blank outcome are skipped. Returns a per-row
+    accept/reject/skip report plus the recomputed status of touched weeks.
+    """
+    if not is_admin_session():
+        abort(403, "Admin locked")
+    db = SessionLocal()
+    rows = parse_bulk_results_payload()
+
+    match_numbers = set()
+    for r in rows:
+        try:
+            match_numbers.add(int(r.get("match_number")))
+        except (TypeError, ValueError):
+            pass
+    # One query for every referenced fixture; match numbers are unique per week
+    by_number: Dict[int, List[Fixture]] = {}
+    if match_numbers:
+        for f in db.query(Fixture).filter(Fixture.match_number.in_(match_numbers)):
+            by_number.setdefault(f.match_number, []).append(f)
+    week_ids = {f.week_id for fxs in by_number.values() for f in fxs}
+    week_by_id = {w.id: w for w in db.query(Week).filter(Week.id.in_(week_ids))} if week_ids else {}
+
+    report = []
+    outcomes: Dict[int, str] = {}
+    touched: Dict[int, Week] = {}
+    for i, r in enumerate(rows, start=1):
+        entry = {"row": i, "match_number": r.get("match_number"), "outcome": r.get("outcome")}
+        report.append(entry)
+        try:
+            mn = int(r.get("match_number"))
+        except (TypeError, ValueError):
+            entry.update(status="rejected", error="match_number must be an integer")
+            continue
+        candidates = by_number.get(mn, [])
+        week_raw = str(r.get("week") or "").strip()
+        if week_raw:
+            try:
+                wk_number = int(week_raw)
+            except ValueError:
+                entry.update(status="rejected", error="week must be an integer")
+                continue
+            candidates = [f for f in candidates if week_by_id[f.week_id].number == wk_number]
+        if not candidates:
+            entry.update(status="rejected", error="Fixture not found")
+            continue
+        if len(candidates) > 1:
+            entry.update(status="rejected", error="Match number is in several weeks; give a week")
+            continue
+        fx = candidates[0]
+        raw = str(r.get("outcome") or "").strip()
+        if not raw:
+            entry.update(status="skipped")  # e.g. an unplayed match in the fixtures CSV
+            continue
+        outcome = canonical_outcome(fx, raw) or BULK_OUTCOME_ALIASES.get(raw.lower()) or score_outcome(raw)
+        if outcome is None:
+            entry.update(status="rejected", error="Outcome must be a fixture team name, Home, Away, Draw or a score")
+            continue
+        outcomes[fx.id] = outcome  # last row wins for duplicates
+        touched[fx.week_id] = week_by_id[fx.week_id]
+        entry.update(status="accepted", week=week_by_id[fx.week_id].number, result=outcome)
+
+    def write(wdb):
+        try:
+            upsert_results(wdb, outcomes)
+            statuses = {}
+            for week_id in touched:
+                wk = wdb.get(Week, week_id)
+                update_week_status(wdb, wk, commit=False)
+                statuses[wk.number] = wk.status
+            wdb.flush()
+            return statuses
+        except Exception as e:
+            abort(400, f"Bulk update failed: {e}")
+
+    statuses = writer.submit(write)
+    accepted = sum(1 for e in report if e["status"] == "accepted")
+    skipped = sum(1 for e in report if e["status"] == "skipped")
+    return jsonify({
+        "accepted": accepted,
+        "rejected": len(report) - accepted - skipped,
+        "skipped": skipped,
+        "rows": report,
+        "weeks": [{"week": number, "status": status} for number, status in sorted(statuses.items())],
+    })
+
+def render_season_totals_fragment(db) -> str:
+    """Totals from report_session's `db` (the same snapshot the weekly rollup reads)."""
+    # Totals only change when some week's data/status does
+    version = tuple(db.query(Week.id, Week.version, Week.status).order_by(Week.id.asc()).all())
+    return fragment_cache.get_or_render(
+        ("season-totals", None, version),
+        lambda: render_template_string(SEASON_TOTALS_PARTIAL, **load_season_totals(db, report_standings(db))))
 
 @app.get("/tab/season")
 def tab_season():
-    db = SessionLocal()
-    you = current_player(db)
-    weeks = db.query(Week).order_by(Week.number.asc()).all()
+    """Totals composed in; the weekly rollup streams in a window at a time as it scrolls into view."""
+    db, taken_at = report_session()
     players = db.query(Player).order_by(Player.name.asc()).all()
-    totals = season_totals_finalized(db)
-    season_rows = []
-    for p in players:
-        season_rows.append({
-            "name": p.name,
-            "for": totals.get(p.id, {}).get("for", 0),
-            "against": totals.get(p.id, {}).get("against", 0),
-            "net": totals.get(p.id, {}).get("net", 0),
-        })
-    weekly_points: Dict[int, Dict[int,int]] = {}
-    for wk in weeks:
-        weekly_points[wk.number] = weekly_points_map(db, wk)
-    return render_template_string(SEASON_PARTIAL, season_rows=season_rows, players=players,
-                                  weeks=weeks, weekly_points=weekly_points, you=you)
+    return with_snapshot_headers(Response(render_template_string(
+        SEASON_PARTIAL, players=players, totals_html=render_season_totals_fragment(db),
+        has_weeks=db.query(Week.id).first() is not None, as_of=taken_at)), taken_at)
+
+@app.get("/partials/season/totals")
+def season_totals_partial():
+    db, taken_at = report_session()
+    return with_snapshot_headers(Response(render_season_totals_fragment(db)), taken_at)
+
+@app.get("/partials/season/weeks")
+def season_weeks_partial():
+    """Up to SEASON_WINDOW weeks numbered below ?before (newest first) plus a 'load more' row."""
+    db, taken_at = report_session()
+    before = request.args.get("before", type=int)
+    limit = max(1, min(request.args.get("limit", SEASON_WINDOW, type=int), 100))
+    q = db.query(Week)
+    if before is not None:
+        q = q.filter(Week.number < before)
+    page = q.order_by(Week.number.desc()).limit(limit + 1).all()
+    weeks, more = page[:limit], len(page) > limit
+    next_before = weeks[-1].number if more else None
+
+    def render():
+        players = db.query(Player).order_by(Player.name.asc()).all()
+        return render_template_string(SEASON_WEEKS_PARTIAL, players=players, weeks=weeks,
+                                      weekly_points=load_season_weeks(db, weeks), next_before=next_before)
+    version = tuple((wk.id, wk.version, wk.status) for wk in weeks)
+    return with_snapshot_headers(
+        Response(fragment_cache.get_or_render(("season-weeks", None, version, next_before), render)), taken_at)
 
 # -------------------- Page shell --------------------
 @app.route("/")
 def shell():
     db = SessionLocal()
     you = current_player(db)
-    initial = tab_current()
+    initial = tab_current()  # composed server-side: no follow-up partial requests on first paint
     return render_template_string(BASE_HTML, you=you, active_tab='current', body=initial)
 
 # -------------------- Partials used within tabs --------------------
+def render_fixtures_fragment(db, wk: Week, data: Optional[WeekState] = None) -> str:
+    def render():
+        fixtures = (data or week_states.get(wk)).fixtures
+        return render_template_string(FIXTURES_PARTIAL, fixtures=fixtures)
+    return fragment_cache.get_or_render(("fixtures", wk.id, wk.fixtures_version), render)
+
+def render_matchups_fragment(db, wk: Week, you, data: Optional[WeekState] = None) -> str:
+    matchups = load_matchups_view(db, wk, data)
+    return render_template_string(MATCHUPS_PARTIAL, matchups=matchups, week=wk, you=you)
+
+def render_scores_fragment(db, wk: Week, data: Optional[WeekState] = None) -> str:
+    return fragment_cache.get_or_render(
+        ("scores", wk.id, wk.version, wk.status),
+        lambda: render_template_string(SCORES_PARTIAL, week=wk, **load_scores_view(db, wk, data)))
+
+def render_current(db, wk: Week, you) -> str:
+    """Current-week tab with fixtures, scores and matchups composed in (one load, one response)."""
+    data = week_states.get(wk)
+    return render_template_string(CURRENT_PARTIAL, current_week=wk, you=you,
+                                  fixtures_html=render_fixtures_fragment(db, wk, data),
+                                  scores_html=render_scores_fragment(db, wk, data),
+                                  matchups_html=render_matchups_fragment(db, wk, you, data))
+
 @app.route("/partials/fixtures/<int:week_number>")
 def fixtures_partial(week_number: int):
     db = SessionLocal()
     wk = db.query(Week).filter_by(number=week_number).first()
-    fixtures = db.query(Fixture).filter_by(week_id=wk.id).order_by(Fixture.match_number.asc()).all()
-    return render_template_string(FIXTURES_PARTIAL, fixtures=fixtures)
+    return render_fixtures_fragment(db, wk)
 
 @app.route("/partials/matchups/<int:week_number>")
 def matchups_partial(week_number: int):
     db = SessionLocal()
     wk = db.query(Week).filter_by(number=week_number).first()
     you = current_player(db)
-    matchups = []
-    for m in db.query(Matchup).filter_by(week_id=wk.id).all():
-        turn_id = compute_next_turn(db, m)
-        avail = available_fixtures_for_matchup(db, m)
-        avail_view = [{"id": f.id, "match_number": f.match_number, "home": f.home, "away": f.away} for f in avail]
-        log = []
-        for p in db.query(Pick).filter_by(matchup_id=m.id).order_by(Pick.created_at.asc(), Pick.id.asc()).all():
-            log.append({
-                "player": p.player.name,
-                "match_number": p.fixture.match_number,
-                "home": p.fixture.home,
-                "away": p.fixture.away,
-                "team": p.team,
-                "when": p.created_at.strftime("%H:%M:%S")
-            })
-        matchups.append({
-            "id": m.id,
-            "a": m.player_a.name,
-            "b": m.player_b.name,
-            "first": m.first_picker.name,
-            "turn_id": turn_id,
-            "turn_name": db.query(Player).get(turn_id).name,
-            "available": avail_view,
-            "log": log
-        })
-    return render_template_string(MATCHUPS_PARTIAL, matchups=matchups, week=wk, you=you)
+    return render_matchups_fragment(db, wk, you)
 
 @app.route("/partials/scores/<int:week_number>")
 def scores_partial(week_number: int):
     db = SessionLocal()
     wk = db.query(Week).filter_by(number=week_number).first()
-    update_week_status(db, wk)
-    points = weekly_points_map(db, wk)
-    scores = [{"name": pl.name, "points": points.get(pl.id, 0)} for pl in db.query(Player).all()]
-    payouts = payouts_for_week(db, wk)
-    fixtures = db.query(Fixture).filter_by(week_id=wk.id).order_by(Fixture.match_number.asc()).all()
-    # map fixture_id -> outcome
-    results_map = {r.fixture_id: r.outcome for r in db.query(Result).join(Fixture).filter(Fixture.week_id==wk.id)}
-    fixtures_with_results = []
-    for f in fixtures:
-        outcome = results_map.get(f.id)
-        if outcome == "Home":
-            display = f.home
-        elif outcome == "Away":
-            display = f.away
-        elif outcome == "Draw":
-            display = "Draw"
-        else:
-            display = "—"
-        fixtures_with_results.append({
-            "match_number": f.match_number,
-            "home": f.home,
-            "away": f.away,
-            "outcome_display": display
-        })
-    return render_template_string(SCORES_PARTIAL, week=wk, scores=scores, payouts=payouts,
-                                  fixtures=fixtures, fixtures_with_results=fixtures_with_results)
+    sync_week_status(db, wk)
+    return render_scores_fragment(db, wk)
 
 
-def payouts_for_week(db, week):
-    points = weekly_points_map(db, week)
+def payouts_for_week(db, week, data: Optional[WeekState] = None):
+    data = data or week_states.get(week)
+    points = data.points()
     rows = []
-    for m in db.query(Matchup).filter_by(week_id=week.id).all():
+    for m in data.matchups:
         pa = points.get(m.player_a_id, 0); pb = points.get(m.player_b_id, 0)
+        a_name = data.players[m.player_a_id].name; b_name = data.players[m.player_b_id].name
         diff = pa - pb
         if diff > 0:
-            rows.append({"from": m.player_b.name, "to": m.player_a.name, "points": diff, "payout": diff*5})
+            rows.append({"from": b_name, "to": a_name, "points": diff, "payout": diff*5})
         elif diff < 0:
-            rows.append({"from": m.player_a.name, "to": m.player_b.name, "points": -diff, "payout": -diff*5})
+            rows.append({"from": a_name, "to": b_name, "points": -diff, "payout": -diff*5})
         else:
             rows.append({"from": "-", "to": "-", "points": 0, "payout": 0})
     return rows
@@ -837,69 +2092,178 @@ def make_pick():
     me = current_player(db)
     if me is None:
         abort(403, "Not logged in")
+    me_id = me.id
     wk_number = int(request.form["week"])
-    wk = db.query(Week).filter_by(number=wk_number).first()
-    m = db.query(Matchup).get(int(request.form["matchup_id"]))
+    matchup_id = int(request.form["matchup_id"])
     fx_id = int(request.form["fixture_id"])
     team_name = request.form["team"].strip()
 
-    if m.week_id != wk.id:
-        abort(400, "Bad matchup/week")
-
-    turn_id = compute_next_turn(db, m)
-    if me.id != turn_id:
-        abort(400, "Not your turn in this matchup")
-
-    # Ensure the fixture is still available in this matchup
-    avail_ids = [f.id for f in available_fixtures_for_matchup(db, m)]
-    if fx_id not in avail_ids:
-        abort(400, "Fixture already taken or not in this week")
-
-    fx = db.query(Fixture).get(fx_id)
-    if team_name not in (fx.home, fx.away):
-        abort(400, "Team must be one of the fixture teams")
-
-    try:
-        p = Pick(matchup_id=m.id, player_id=me.id, fixture_id=fx.id, team=team_name)
-        db.add(p); db.commit()
-    except Exception as e:
-        db.rollback()
-        abort(400, f"Pick failed: {e}")
+    # Turn/availability checks run on the writer so they can't race another pick
+    def write(wdb):
+        wk = wdb.query(Week).filter_by(number=wk_number).first()
+        m = wdb.get(Matchup, matchup_id)
+        if m.week_id != wk.id:
+            abort(400, "Bad matchup/week")
+
+        turn_id = compute_next_turn(wdb, m)
+        if me_id != turn_id:
+            abort(400, "Not your turn in this matchup")
+
+        fx = wdb.get(Fixture, fx_id)
+        if fx is not None and fixture_started(fx):
+            abort(400, "Fixture has already kicked off")
+
+        # Ensure the fixture is still available in this matchup
+        avail_ids = [f.id for f in available_fixtures_for_matchup(wdb, m)]
+        if fx_id not in avail_ids:
+            abort(400, "Fixture already taken or not in this week")
+
+        if team_name not in (fx.home, fx.away):
+            abort(400, "Team must be one of the fixture teams")
+
+        try:
+            pick = Pick(matchup_id=m.id, player_id=me_id, fixture_id=fx.id, team=team_name)
+            wdb.add(pick)
+            bump_week_versions(wdb, [m.week_id])
+            record_event(wdb, "PickMade", m.week_id, matchup_id=m.id, player_id=me_id, fixture_id=fx.id,
+                         team=team_name, side="Home" if team_name == fx.home else "Away")
+            wdb.flush()
+        except Exception as e:
+            abort(400, f"Pick failed: {e}")
+        version = wdb.query(Week.version).filter_by(id=m.week_id).scalar()
+        return m.week_id, version, PickRec(pick.id, m.id, me_id, fx.id, team_name, pick.created_at)
+
+    week_states.add_pick(*writer.submit(write))
 
     # Re-render the matchups panel after pick
-    return matchups_partial(wk.number)
+    return matchups_partial(wk_number)
 
 @app.post("/set_result")
 def set_result():
-    db = SessionLocal()
     wk_number = int(request.form["week"])
-    wk = db.query(Week).filter_by(number=wk_number).first()
     fx_id = int(request.form["fixture_id"])
     raw = request.form["outcome"].strip()
 
-    fx = db.query(Fixture).get(fx_id)
-    if fx.week_id != wk.id:
-        abort(400, "Fixture not in this week")
+    def write(wdb):
+        wk = wdb.query(Week).filter_by(number=wk_number).first()
+        fx = wdb.get(Fixture, fx_id)
+        if fx.week_id != wk.id:
+            abort(400, "Fixture not in this week")
 
-    # Map team name / Draw to canonical outcome
-    if raw.lower() == "draw":
-        outcome = "Draw"
-    elif raw == fx.home:
-        outcome = "Home"
-    elif raw == fx.away:
-        outcome = "Away"
-    else:
-        abort(400, "Outcome must be one of the fixture's team names or Draw")
+        # Map team name / Draw to canonical outcome
+        outcome = canonical_outcome(fx, raw)
+        if outcome is None:
+            abort(400, "Outcome must be one of the fixture's team names or Draw")
 
-    existing = db.query(Result).filter_by(fixture_id=fx.id).first()
-    if existing:
-        existing.outcome = outcome
-    else:
-        db.add(Result(fixture_id=fx.id, outcome=outcome))
-    db.commit()
-    # Auto-finalization update
-    update_week_status(db, wk)
-    return scores_partial(wk.number)
+        upsert_results(wdb, {fx.id: outcome})
+        # Auto-finalization update
+        update_week_status(wdb, wk, commit=False)
+        return wk.id, wdb.query(Week.version).filter_by(id=wk.id).scalar(), fx.id, outcome
+
+    week_states.set_result(*writer.submit(write))
+    return scores_partial(wk_number)
+
+# -------------------- JSON API (v1) --------------------
+
+def week_summary(wk: Week) -> dict:
+    return {"number": wk.number, "status": wk.status}
+
+def api_week_or_404(db, week_number: int) -> Week:
+    wk = db.query(Week).filter_by(number=week_number).first()
+    if wk is None:
+        abort(404, "Week not found")
+    return wk
+
+def api_response(payload: dict) -> Response:
+    """Encode payload as compact JSON, honouring ?fields=a,b and If-None-Match."""
+    fields = request.args.get("fields", "")
+    if fields:
+        wanted = {f.strip() for f in fields.split(",") if f.strip()}
+        payload = {k: v for k, v in payload.items() if k in wanted}
+    body = _json_encoder.encode(payload)
+    resp = Response(body, mimetype="application/json")
+    resp.set_etag(hashlib.sha1(body).hexdigest())
+    resp.headers["Cache-Control"] = "no-cache"
+    return resp.make_conditional(request)
+
+@app.get("/api/v1/weeks/<int:week_number>/board")
+def api_week_board(week_number: int):
+    """Draft board: fixtures plus per-matchup turn, available fixtures and pick log."""
+    db = SessionLocal()
+    wk = api_week_or_404(db, week_number)
+    data = week_states.get(wk)  # one state for both halves, so fixtures and matchups share a version
+    matchups = load_matchups_view(db, wk, data)
+    for m in matchups:
+        for entry in m["log"]:
+            entry.pop("when", None)  # display-only; "at" carries the timestamp
+    now = datetime.utcnow()
+    return api_response({
+        "week": week_summary(wk),
+        "fixtures": [{"id": f.id, "match_number": f.match_number, "home": f.home, "away": f.away,
+                      "kickoff": f.kickoff, "started": fixture_started(f, now)} for f in data.fixtures],
+        "matchups": matchups,
+    })
+
+@app.get("/api/v1/weeks/<int:week_number>/scores")
+def api_week_scores(week_number: int):
+    """Points, payouts and results for a week (same data as the scores partial)."""
+    db = SessionLocal()
+    wk = api_week_or_404(db, week_number)
+    sync_week_status(db, wk)
+    view = load_scores_view(db, wk)
+    return api_response({
+        "week": week_summary(wk),
+        "scores": view["scores"],
+        "payouts": view["payouts"],
+        "results": view["fixtures_with_results"],
+    })
+
+@app.get("/api/v1/season")
+def api_season():
+    """Season standings (finalized weeks) and the weekly points rollup keyed by player name."""
+    db, taken_at = report_session()
+    view = load_season_view(db, totals=report_standings(db))
+    players = view["players"]
+    return with_snapshot_headers(api_response({
+        "standings": view["season_rows"],
+        "weeks": [
+            dict(week_summary(wk),
+                 points={p.name: view["weekly_points"][wk.number].get(p.id, 0) for p in players})
+            for wk in view["weeks"]
+        ],
+    }), taken_at)
+
+@app.get("/api/v1/events")
+def api_events():
+    """Event log page after ?after=<offset>; resume with the returned next_offset."""
+    db = SessionLocal()
+    after = request.args.get("after", 0, type=int)
+    limit = min(request.args.get("limit", 200, type=int), 1000)
+    events = events_since(db, after, limit)
+    return api_response({"events": events, "next_offset": events[-1]["offset"] if events else after})
+
+@app.get("/api/v1/events/stream")
+def api_events_stream():
+    """Server-sent events from ?after= (or Last-Event-ID); the event id is the log offset."""
+    after = request.headers.get("Last-Event-ID", type=int) or request.args.get("after", 0, type=int)
+
+    def stream(offset: int):
+        generation = event_feed.generation
+        while True:
+            db = SessionLocal()
+            try:
+                batch = events_since(db, offset)
+            finally:
+                SessionLocal.remove()
+            for e in batch:
+                offset = e["offset"]
+                yield f"id: {offset}\nevent: {e['kind']}\ndata: {_json_encoder.encode(e).decode()}\n\n"
+            if not batch:
+                yield ": keepalive\n\n"
+                generation = event_feed.wait(generation, timeout=15)
+
+    return Response(stream(after), mimetype="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
 
 # -------------------- Join flow --------------------
 @app.route("/join", methods=["GET", "POST"])
@@ -921,6 +2285,620 @@ def join():
         return redirect(url_for("shell"))
     return render_template_string(JOIN_HTML, allowed_names=allowed_names)
 
+# -------------------- Kickoff scheduler --------------------
+class KickoffScheduler:
+    """Fires jobs at fixture kickoff boundaries from a time-ordered heap on one daemon thread.
+
+    Only distinct future kickoffs are loaded (indexed range scan); the thread sleeps until
+    the earliest one instead of polling the fixtures table.
+    """
+
+    def __init__(self):
+        self._heap: List[tuple] = []
+        self._seq = itertools.count()
+        self._cv = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self.kickoffs_loaded = False   # this process schedules kickoff jobs (see reload_kickoffs)
+        self.fixtures_offset = 0       # newest fixture-changing event the kickoff jobs reflect
+
+    def schedule(self, when: datetime, fn: Callable, *args) -> None:
+        with self._cv:
+            heapq.heappush(self._heap, (when, next(self._seq), fn, args))
+            self._cv.notify()
+
+    def schedule_in(self, seconds: float, fn: Callable, *args) -> None:
+        self.schedule(datetime.utcnow() + timedelta(seconds=seconds), fn, *args)
+
+    def clear(self, fn: Optional[Callable] = None) -> None:
+        """Drop every pending job, or only those that would call `fn`."""
+        with self._cv:
+            self._heap = [j for j in self._heap if fn is not None and j[2] is not fn]
+            heapq.heapify(self._heap)
+            self._cv.notify()
+
+    def load_from_db(self) -> int:
+        """(Re)build kickoff jobs from every future kickoff time; returns how many were scheduled."""
+        self.clear(kickoff_boundary_job)
+        def read(db):
+            now = datetime.utcnow()
+            return (latest_fixture_change(db),
+                    [ko for (ko,) in db.query(Fixture.kickoff)
+                     .filter(Fixture.kickoff > now).distinct().order_by(Fixture.kickoff.asc())])
+        self.fixtures_offset, kickoffs = read_consistently(read)
+        for ko in kickoffs:
+            self.schedule(ko, kickoff_boundary_job, ko)
+        self.kickoffs_loaded = True
+        return len(kickoffs)
+
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if not self.running():  # a forked worker inherits the object but not the thread
+            self._thread = threading.Thread(target=self._run, name="kickoff-scheduler", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cv:
+                while not self._heap:
+                    self._cv.wait()
+                when, _, fn, args = self._heap[0]
+                delay = (when - datetime.utcnow()).total_seconds()
+                if delay > 0:
+                    self._cv.wait(timeout=delay)
+                    continue  # re-check: an earlier job may have been pushed meanwhile
+                heapq.heappop(self._heap)
+            try:
+                fn(*args)
+            except Exception:
+                app.logger.exception("Scheduled job %s failed", getattr(fn, "__name__", fn))
+
+FIXTURE_EVENT_KINDS = ("WeekReinitialized", "FixturesSynced", "SeasonArchived")
+KICKOFF_RELOAD_INTERVAL = int(os.environ.get("KICKOFF_RELOAD_SECONDS", "60"))
+
+def latest_fixture_change(db) -> int:
+    return (db.query(Event.id).filter(Event.kind.in_(FIXTURE_EVENT_KINDS))
+            .order_by(Event.id.desc()).limit(1).scalar() or 0)
+
+def kickoff_boundary_job(kickoff: datetime) -> None:
+    """At a kickoff: bump the versions of weeks with fixtures locking now.
+
+    Availability depends on the clock, not on a write, so without the bump cached WeekState,
+    fragments and SSE subscribers would keep offering the started fixtures.
+    """
+    def write(db):
+        fixtures = db.query(Fixture.id, Fixture.week_id).filter(Fixture.kickoff == kickoff).all()
+        by_week: Dict[int, List[int]] = {}
+        for fid, week_id in fixtures:
+            by_week.setdefault(week_id, []).append(fid)
+        bump_week_versions(db, by_week)
+        for week_id, fixture_ids in by_week.items():
+            record_event(db, "FixturesLocked", week_id, fixture_ids=fixture_ids, kickoff=kickoff)
+            app.logger.info("Week id %s: locked %d fixture(s) kicking off %s UTC", week_id, len(fixture_ids), kickoff)
+    try:
+        writer.submit(write)
+    finally:
+        SessionLocal.remove()
+
+def reload_kickoffs() -> None:
+    """Reschedule kickoff jobs after fixtures changed in this process (no-op where none are scheduled)."""
+    if scheduler.kickoffs_loaded:
+        scheduler.load_from_db()
+
+def kickoff_reload_job() -> None:
+    """Recurring: pick up fixtures another process (init / --sync CLI) added or moved."""
+    try:
+        if read_consistently(latest_fixture_change) != scheduler.fixtures_offset:
+            scheduler.load_from_db()
+    finally:
+        scheduler.schedule_in(KICKOFF_RELOAD_INTERVAL, kickoff_reload_job)
+
+scheduler = KickoffScheduler()
+
+# -------------------- Read snapshots for reports --------------------
+# Heavy report reads (season rollup, analytics, season export) run against a read-only copy
+# of the live DB taken with SQLite's online backup API, so their long read transactions never
+# pin the WAL the draft writer appends to. Falls back to the live DB until a snapshot exists.
+READ_SNAPSHOTS = os.environ.get("READ_SNAPSHOTS", "1") == "1"
+READ_SNAPSHOT_DIR = os.environ.get("READ_SNAPSHOT_DIR", "snapshots")
+READ_SNAPSHOT_INTERVAL = int(os.environ.get("READ_SNAPSHOT_INTERVAL_SECONDS", "300"))
+READ_SNAPSHOT_KEEP = 2  # the previous copy stays for readers that opened it just before a swap
+
+class ReadSnapshots:
+    """Takes backup-API copies of the live SQLite file and hands out sessions on the newest."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._take_lock = threading.Lock()
+        self._engines: Dict[str, object] = {}
+        self._current: Optional[dict] = None
+        self._dir_mtime: Optional[int] = None
+        self.taken = 0
+
+    def enabled(self) -> bool:
+        return READ_SNAPSHOTS and engine.url.get_backend_name() == "sqlite" and engine.url.database not in (None, "", ":memory:")
+
+    def take(self) -> str:
+        """Copy the live DB in one backup step (a consistent point in time) and publish it."""
+        with self._take_lock:
+            os.makedirs(self.directory, exist_ok=True)
+            taken_at = datetime.utcnow()
+            path = os.path.join(self.directory, f"read-{taken_at:%Y%m%dT%H%M%S%f}.db")
+            src = sqlite3.connect(engine.url.database)
+            dst = sqlite3.connect(path + ".tmp")
+            try:
+                src.backup(dst)
+                dst.execute("PRAGMA journal_mode=DELETE")  # a self-contained file; no -wal/-shm to open read-only
+            finally:
+                dst.close()
+                src.close()
+            os.chmod(path + ".tmp", 0o600)  # a full copy of the DB: as private as the original
+            os.replace(path + ".tmp", path)
+            for old in self._files()[:-READ_SNAPSHOT_KEEP]:
+                os.remove(os.path.join(self.directory, old))
+            self.taken += 1
+            return path
+
+    def _files(self) -> List[str]:
+        try:
+            return sorted(f for f in os.listdir(self.directory) if f.startswith("read-") and f.endswith(".db"))
+        except FileNotFoundError:
+            return []
+
+    def current(self) -> Optional[dict]:
+        """Newest snapshot as {"factory", "taken_at", "path"} (rescans only when the dir changed)."""
+        if not self.enabled():
+            return None
+        try:
+            mtime = os.stat(self.directory).st_mtime_ns
+        except FileNotFoundError:
+            return None
+        with self._lock:
+            if mtime == self._dir_mtime:
+                return self._current
+            files = self._files()
+            if not files:
+                self._current, self._dir_mtime = None, mtime
+                return None
+            path = os.path.join(self.directory, files[-1])
+            if path not in self._engines:
+                self._engines[path] = create_engine(f"sqlite:///file:{os.path.abspath(path)}?mode=ro&uri=true",
+                                                    connect_args={"check_same_thread": False})
+            for stale in [p for p in self._engines if p != path and os.path.basename(p) not in files]:
+                self._engines.pop(stale).dispose()
+            self._current = {"factory": sessionmaker(bind=self._engines[path]), "path": path,
+                             "taken_at": datetime.strptime(files[-1][5:-3], "%Y%m%dT%H%M%S%f")}
+            self._dir_mtime = mtime
+            return self._current
+
+    def stats(self) -> dict:
+        snap = self.current()
+        return {"enabled": self.enabled(), "taken": self.taken,
+                "path": snap["path"] if snap else None,
+                "age_seconds": round((datetime.utcnow() - snap["taken_at"]).total_seconds(), 1) if snap else None}
+
+    def standings(self, snap: dict) -> Dict[int, Dict[str, int]]:
+        """Season totals as of `snap`, folded from its own tables once and kept with it."""
+        totals = snap.get("standings")
+        if totals is None:
+            db = snap["factory"]()
+            try:
+                totals = snap["standings"] = StandingsProjection(projection_state_from_tables(db)).totals()
+            finally:
+                db.close()
+        return totals
+
+read_snapshots = ReadSnapshots(READ_SNAPSHOT_DIR)
+
+def report_session():
+    """(db, taken_at) for report routes: newest read snapshot, or the live DB (taken_at None)."""
+    snap = g.get("report_snapshot") or read_snapshots.current()
+    if snap is None:
+        return SessionLocal(), None
+    db = g.get("report_db")
+    if db is None:
+        g.report_snapshot = snap
+        db = g.report_db = snap["factory"]()
+    return db, snap["taken_at"]
+
+def report_standings(db) -> Dict[int, Dict[str, int]]:
+    """Season totals matching report_session's `db`, so one response never mixes two points in time."""
+    snap = g.get("report_snapshot")
+    return read_snapshots.standings(snap) if snap else season_standings(db)
+
+@app.template_global()
+def snapshot_label(taken_at: Optional[datetime]) -> str:
+    if taken_at is None:
+        return "Live data"
+    age = int((datetime.utcnow() - taken_at).total_seconds())
+    return f"As of {taken_at:%H:%M:%S} UTC ({age // 60}m {age % 60}s ago)"
+
+def with_snapshot_headers(resp: Response, taken_at: Optional[datetime]) -> Response:
+    resp.headers["X-Data-As-Of"] = taken_at.strftime("%Y-%m-%dT%H:%M:%SZ") if taken_at else "live"
+    return resp
+
+def read_snapshot_job(reschedule: bool = True) -> None:
+    """Recurring (and after a week finalizes): refresh the report snapshot."""
+    try:
+        if read_snapshots.enabled():
+            read_snapshots.take()
+    except Exception:
+        app.logger.exception("Read snapshot failed")
+    finally:
+        if reschedule and READ_SNAPSHOT_INTERVAL > 0:
+            scheduler.schedule_in(READ_SNAPSHOT_INTERVAL, read_snapshot_job)
+
+@event.listens_for(SessionFactory, "after_commit")
+def snapshot_after_finalization(db):
+    if db.info.pop("week_finalized", False) and read_snapshots.enabled() and scheduler.running():
+        scheduler.schedule_in(0, read_snapshot_job, False)
+
+@event.listens_for(SessionFactory, "after_rollback")
+def forget_finalization_on_rollback(db):
+    db.info.pop("week_finalized", None)
+
+# -------------------- Analytics index --------------------
+# Each live week's contribution (pairs, team picks, side picks) is stored alongside the
+# aggregates. On a result write the old contribution is subtracted and the recomputed one
+# added, so reads are primary-key lookups and corrections never need a full rescan.
+ANALYTICS_TABLES = (
+    ("pair", AnalyticsPair, ("player", "opponent"), ("played", "wins", "losses", "draws", "points_for", "points_against")),
+    ("team", AnalyticsTeam, ("player", "team"), ("picks", "wins", "losses", "draws")),
+    ("side", AnalyticsSide, ("player", "side"), ("picks", "wins", "losses", "draws")),
+)
+
+def week_analytics_contribution(db, wk: Week) -> dict:
+    """Aggregate rows for one week. Weeks with no results yet contribute nothing."""
+    data = WeekState(db, wk)
+    out = {"pair": [], "team": [], "side": []}
+    if not data.results:
+        return out
+    team: Dict[Tuple[str, str], List[int]] = {}
+    side: Dict[Tuple[str, str], List[int]] = {}
+    for picks in data.picks_by_matchup.values():
+        for p in picks:
+            fx = data.fixtures_by_id[p.fixture_id]
+            name = data.players[p.player_id].name
+            picked_side = "Home" if p.team == fx.home else "Away"
+            outcome = data.results.get(fx.id)
+            for table, key in ((team, (name, p.team)), (side, (name, picked_side))):
+                row = table.setdefault(key, [0, 0, 0, 0])
+                row[0] += 1
+                if outcome is not None:
+                    row[3 if outcome == "Draw" else 1 if outcome == picked_side else 2] += 1
+    out["team"] = [[*k, *v] for k, v in team.items()]
+    out["side"] = [[*k, *v] for k, v in side.items()]
+    if len(data.results) >= len(data.fixtures):  # head-to-head only counts decided (finalized) weeks
+        points = data.points()
+        for m in data.matchups:
+            a, b = data.players[m.player_a_id].name, data.players[m.player_b_id].name
+            pa, pb = points.get(m.player_a_id, 0), points.get(m.player_b_id, 0)
+            for x, y, px, py in ((a, b, pa, pb), (b, a, pb, pa)):
+                out["pair"].append([x, y, 1, int(px > py), int(px < py), int(px == py), px, py])
+    return out
+
+def apply_analytics(db, contribution: dict, sign: int) -> None:
+    for key, model, pk, counters in ANALYTICS_TABLES:
+        rows = contribution.get(key) or []
+        if not rows:
+            continue
+        values = [dict(zip(pk, r[:len(pk)]), **{c: sign * v for c, v in zip(counters, r[len(pk):])})
+                  for r in rows]
+        stmt = sqlite_insert(model.__table__).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(pk),
+            set_={c: model.__table__.c[c] + stmt.excluded[c] for c in counters})
+        db.execute(stmt)
+
+def refresh_week_analytics(db, week_ids: Iterable[int]) -> None:
+    """Swap each week's stored contribution for a freshly computed one (no commit)."""
+    for wk in db.query(Week).filter(Week.id.in_(set(week_ids))).all():
+        stored = db.get(AnalyticsWeek, wk.id)
+        if stored is not None:
+            apply_analytics(db, msgspec.json.decode(stored.contribution), -1)
+        new = week_analytics_contribution(db, wk)
+        apply_analytics(db, new, +1)
+        encoded = _json_encoder.encode(new).decode()
+        if stored is None:
+            db.add(AnalyticsWeek(week_id=wk.id, contribution=encoded))
+        else:
+            stored.contribution = encoded
+
+def hit_rate(row) -> Optional[float]:
+    decided = row.wins + row.losses + row.draws
+    return round(row.wins / decided, 3) if decided else None
+
+def stats_view(db, player: Optional[str] = None, opponent: Optional[str] = None) -> dict:
+    pairs = db.query(AnalyticsPair)
+    teams = db.query(AnalyticsTeam)
+    sides = db.query(AnalyticsSide)
+    if player:
+        pairs = pairs.filter(AnalyticsPair.player == player)
+        teams = teams.filter(AnalyticsTeam.player == player)
+        sides = sides.filter(AnalyticsSide.player == player)
+    if opponent:
+        pairs = pairs.filter(AnalyticsPair.opponent == opponent)
+    return {
+        "head_to_head": [{"player": r.player, "opponent": r.opponent, "played": r.played, "wins": r.wins,
+                          "losses": r.losses, "draws": r.draws, "points_for": r.points_for,
+                          "points_against": r.points_against} for r in pairs if r.played],
+        "teams": [{"player": r.player, "team": r.team, "picks": r.picks, "wins": r.wins, "losses": r.losses,
+                   "draws": r.draws, "hit_rate": hit_rate(r)}
+                  for r in teams.order_by(AnalyticsTeam.player.asc(), AnalyticsTeam.picks.desc()) if r.picks],
+        "sides": [{"player": r.player, "side": r.side, "picks": r.picks, "wins": r.wins, "losses": r.losses,
+                   "draws": r.draws, "hit_rate": hit_rate(r)}
+                  for r in sides.order_by(AnalyticsSide.player.asc(), AnalyticsSide.side.desc()) if r.picks],
+    }
+
+@app.get("/tab/stats")
+def tab_stats():
+    you = current_player(SessionLocal())
+    db, taken_at = report_session()
+    view = stats_view(db)
+    names = sorted({r["player"] for r in view["head_to_head"]} | {r["opponent"] for r in view["head_to_head"]})
+    h2h = {(r["player"], r["opponent"]): r for r in view["head_to_head"]}
+    top_teams, seen = [], {}
+    for r in view["teams"]:  # already ordered by player, picks desc: keep each player's top 3
+        seen[r["player"]] = seen.get(r["player"], 0) + 1
+        if seen[r["player"]] <= 3:
+            top_teams.append(r)
+    return render_template_string(STATS_PARTIAL, names=names, h2h=h2h, teams=top_teams,
+                                  sides=view["sides"], you=you, as_of=taken_at)
+
+@app.get("/api/v1/stats")
+def api_stats():
+    """Analytics index; ?player= (and ?opponent=) narrow to primary-key lookups."""
+    db, taken_at = report_session()
+    return with_snapshot_headers(
+        api_response(stats_view(db, request.args.get("player"), request.args.get("opponent"))), taken_at)
+
+@app.post("/admin/analytics/rebuild")
+def admin_rebuild_analytics():
+    if not is_admin_session():
+        abort(403, "Admin locked")
+    writer.submit(lambda wdb: refresh_week_analytics(wdb, [wid for (wid,) in wdb.query(Week.id)]))
+    return jsonify({"ok": True})
+
+# -------------------- Season archive --------------------
+# A finalized season is moved out of the live tables into one columnar file:
+#   b"PKARCH1\0" | u32 header length | JSON header | 8-byte aligned column blobs
+# The header holds the string dictionary (players + teams), week list and, per column,
+# dtype/offset/count. Readers mmap the file and wrap each column with np.frombuffer,
+# so nothing is copied or parsed row by row.
+ARCHIVE_DIR = os.environ.get("ARCHIVE_DIR", "archives")
+ARCHIVE_MAGIC = b"PKARCH1\0"
+OUTCOME_CODES = {None: 0, "Home": 1, "Away": 2, "Draw": 3}
+
+def write_season_archive(db, path: str, label: str) -> dict:
+    """Serialize every week in the DB to `path`; returns a row-count summary."""
+    strings: List[str] = []
+    string_ids: Dict[str, int] = {}
+    def sid(value: str) -> int:
+        if value not in string_ids:
+            string_ids[value] = len(strings); strings.append(value)
+        return string_ids[value]
+
+    players = {p.id: p.name for p in db.query(Player).all()}
+    weeks = db.query(Week).order_by(Week.number.asc()).all()
+    fixtures = db.query(Fixture).join(Week).order_by(Week.number.asc(), Fixture.match_number.asc()).all()
+    results = dict(db.query(Result.fixture_id, Result.outcome))
+    matchups = db.query(Matchup).join(Week).order_by(Week.number.asc(), Matchup.id.asc()).all()
+    picks = (db.query(Pick).join(Matchup).join(Week)
+             .order_by(Week.number.asc(), Pick.created_at.asc(), Pick.id.asc()).all())
+    week_no = {w.id: w.number for w in weeks}
+    fx_row = {f.id: i for i, f in enumerate(fixtures)}
+    mu_row = {m.id: i for i, m in enumerate(matchups)}
+    epoch = lambda dt: int(dt.replace(tzinfo=timezone.utc).timestamp()) if dt else -1
+
+    columns = {
+        "fixtures.week": np.array([week_no[f.week_id] for f in fixtures], dtype="<i2"),
+        "fixtures.match_number": np.array([f.match_number for f in fixtures], dtype="<i2"),
+        "fixtures.home": np.array([sid(f.home) for f in fixtures], dtype="<i4"),
+        "fixtures.away": np.array([sid(f.away) for f in fixtures], dtype="<i4"),
+        "fixtures.outcome": np.array([OUTCOME_CODES[results.get(f.id)] for f in fixtures], dtype="<i1"),
+        "fixtures.kickoff": np.array([epoch(f.kickoff) for f in fixtures], dtype="<i8"),
+        "matchups.week": np.array([week_no[m.week_id] for m in matchups], dtype="<i2"),
+        "matchups.a": np.array([sid(players[m.player_a_id]) for m in matchups], dtype="<i4"),
+        "matchups.b": np.array([sid(players[m.player_b_id]) for m in matchups], dtype="<i4"),
+        "matchups.first": np.array([sid(players[m.first_picker_id]) for m in matchups], dtype="<i4"),
+        "picks.matchup": np.array([mu_row[p.matchup_id] for p in picks], dtype="<i4"),
+        "picks.player": np.array([sid(players[p.player_id]) for p in picks], dtype="<i4"),
+        "picks.fixture": np.array([fx_row[p.fixture_id] for p in picks], dtype="<i4"),
+        "picks.side": np.array([OUTCOME_CODES["Home" if p.team == p.fixture.home else "Away"] for p in picks],
+                               dtype="<i1"),
+        "picks.created_at": np.array([epoch(p.created_at) for p in picks], dtype="<i8"),
+    }
+    header = {"label": label, "created_at": datetime.utcnow().isoformat(), "strings": strings,
+              "weeks": [{"number": w.number, "status": w.status} for w in weeks], "columns": {}}
+    rel, blobs = {}, []
+    pos = 0
+    for name, arr in columns.items():
+        rel[name] = pos
+        blobs.append(arr.tobytes())
+        pos += -(-arr.nbytes // 8) * 8
+    # Absolute offsets depend on the header's own length: iterate until it stops growing
+    base = 0
+    while True:
+        for name, arr in columns.items():
+            header["columns"][name] = {"dtype": arr.dtype.str, "count": int(arr.size), "offset": base + rel[name]}
+        raw = json.dumps(header, separators=(",", ":")).encode()
+        aligned = -(-(len(ARCHIVE_MAGIC) + 4 + len(raw)) // 8) * 8
+        if aligned == base:
+            break
+        base = aligned
+    pad = base - (len(ARCHIVE_MAGIC) + 4 + len(raw))
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as fh:
+        fh.write(ARCHIVE_MAGIC); fh.write(struct.pack("<I", len(raw) + pad)); fh.write(raw + b" " * pad)
+        for blob in blobs:
+            fh.write(blob); fh.write(b"\0" * (-len(blob) % 8))
+    os.replace(tmp, path)
+    return {"weeks": len(weeks), "fixtures": len(fixtures), "matchups": len(matchups), "picks": len(picks)}
+
+class SeasonArchive:
+    """Read-only, memory-mapped view over one archive file; columns are numpy views into the map."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fh = open(path, "rb")
+        self._mm = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[:len(ARCHIVE_MAGIC)] != ARCHIVE_MAGIC:
+            raise ValueError(f"{path} is not a season archive")
+        (hlen,) = struct.unpack_from("<I", self._mm, len(ARCHIVE_MAGIC))
+        start = len(ARCHIVE_MAGIC) + 4
+        self.header = json.loads(bytes(self._mm[start:start + hlen]))
+        self.label: str = self.header["label"]
+        self.strings: List[str] = self.header["strings"]
+        self.cols = {name: np.frombuffer(self._mm, dtype=c["dtype"], count=c["count"], offset=c["offset"])
+                     for name, c in self.header["columns"].items()}
+
+    def matchup_points(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Points scored by side a and side b of every matchup."""
+        c = self.cols
+        n = len(c["matchups.a"])
+        outcome = c["fixtures.outcome"][c["picks.fixture"]]
+        delta = np.where((outcome == 0) | (outcome == 3), 0, np.where(outcome == c["picks.side"], 1, -1))
+        by_a = c["picks.player"] == c["matchups.a"][c["picks.matchup"]]
+        a_pts = np.bincount(c["picks.matchup"][by_a], weights=delta[by_a], minlength=n).astype(np.int64)
+        b_pts = np.bincount(c["picks.matchup"][~by_a], weights=delta[~by_a], minlength=n).astype(np.int64)
+        return a_pts, b_pts
+
+    def standings(self) -> List[dict]:
+        c = self.cols
+        a_pts, b_pts = self.matchup_points()
+        n = len(self.strings)
+        pf = np.bincount(c["matchups.a"], weights=a_pts, minlength=n) + np.bincount(c["matchups.b"], weights=b_pts, minlength=n)
+        pa = np.bincount(c["matchups.a"], weights=b_pts, minlength=n) + np.bincount(c["matchups.b"], weights=a_pts, minlength=n)
+        ids = np.union1d(c["matchups.a"], c["matchups.b"])
+        rows = [{"name": self.strings[i], "for": int(pf[i]), "against": int(pa[i]), "net": int(pf[i] - pa[i])}
+                for i in ids]
+        return sorted(rows, key=lambda r: r["name"])
+
+    def head_to_head(self) -> Dict[Tuple[str, str], dict]:
+        """Per unordered player pair (alphabetical): meetings, wins each, draws and points."""
+        c = self.cols
+        a_pts, b_pts = self.matchup_points()
+        out: Dict[Tuple[str, str], dict] = {}
+        for a, b, pa, pb in zip(c["matchups.a"].tolist(), c["matchups.b"].tolist(), a_pts.tolist(), b_pts.tolist()):
+            x, y = self.strings[a], self.strings[b]
+            if x > y:
+                x, y, pa, pb = y, x, pb, pa
+            row = out.setdefault((x, y), {"played": 0, "wins": 0, "losses": 0, "draws": 0, "points_for": 0, "points_against": 0})
+            row["played"] += 1; row["points_for"] += pa; row["points_against"] += pb
+            row["wins" if pa > pb else "losses" if pa < pb else "draws"] += 1
+        return out
+
+    def close(self) -> None:
+        self.cols.clear()
+        self._mm.close(); self._fh.close()
+
+_archives: Dict[str, SeasonArchive] = {}
+_archives_lock = threading.Lock()
+
+def open_archives() -> List[SeasonArchive]:
+    """Every archive in ARCHIVE_DIR, opened once per process and kept mapped."""
+    if not os.path.isdir(ARCHIVE_DIR):
+        return []
+    with _archives_lock:
+        for name in sorted(os.listdir(ARCHIVE_DIR)):
+            path = os.path.join(ARCHIVE_DIR, name)
+            if name.endswith(".pka") and path not in _archives:
+                _archives[path] = SeasonArchive(path)
+        return sorted(_archives.values(), key=lambda a: a.label)
+
+def week_version_floor(db) -> int:
+    """Starting version for new weeks: past every version an archived week reached.
+
+    Week ids can be reused after an archive on DBs created before weeks used AUTOINCREMENT,
+    so versions must keep climbing for (week_id, version) cache keys to stay unique.
+    """
+    latest = (db.query(Event.payload).filter(Event.kind == "SeasonArchived")
+              .order_by(Event.id.desc()).limit(1).scalar())
+    return msgspec.json.decode(latest)["next_version"] if latest else 0
+
+def archive_season(label: str) -> dict:
+    """Write the current season to ARCHIVE_DIR/<label>.pka and remove it from the live tables.
+
+    Runs as one writer job, so the reads, the archive file and the deletes all happen under
+    the writer's BEGIN IMMEDIATE: nothing another process commits meanwhile can be deleted
+    without having been archived.
+    """
+    global _standings
+    path = os.path.join(ARCHIVE_DIR, f"{label}.pka")
+    written: List[str] = []
+
+    def archive(db) -> dict:
+        weeks = db.query(Week).all()
+        if not weeks:
+            raise ValueError("No weeks to archive")
+        open_weeks = sorted(w.number for w in weeks if w.status != "finalized")
+        if open_weeks:
+            raise ValueError(f"Weeks not finalized: {open_weeks}")
+        os.makedirs(ARCHIVE_DIR, exist_ok=True)
+        if os.path.exists(path):
+            raise ValueError(f"Archive {path} already exists")
+        written.append(path)
+        summary = write_season_archive(db, path, label)
+        SeasonArchive(path).close()  # verify it reads back before deleting anything
+
+        week_ids = [w.id for w in weeks]
+        mu_ids = [mid for (mid,) in db.query(Matchup.id).filter(Matchup.week_id.in_(week_ids))]
+        fx_ids = [fid for (fid,) in db.query(Fixture.id).filter(Fixture.week_id.in_(week_ids))]
+        db.query(Pick).filter(Pick.matchup_id.in_(mu_ids)).delete(synchronize_session=False)
+        db.query(Result).filter(Result.fixture_id.in_(fx_ids)).delete(synchronize_session=False)
+        db.query(Matchup).filter(Matchup.id.in_(mu_ids)).delete(synchronize_session=False)
+        db.query(Fixture).filter(Fixture.id.in_(fx_ids)).delete(synchronize_session=False)
+        db.query(Event).filter(Event.week_id.in_(week_ids)).delete(synchronize_session=False)
+        db.query(StandingsSnapshot).delete(synchronize_session=False)  # they fold in archived weeks
+        db.query(AnalyticsWeek).filter(AnalyticsWeek.week_id.in_(week_ids)).delete(synchronize_session=False)
+        db.query(Week).filter(Week.id.in_(week_ids)).delete(synchronize_session=False)
+        # Tells running processes (via their standings projection) to drop the season's state
+        record_event(db, "SeasonArchived", None, label=label,
+                     next_version=max([week_version_floor(db)] + [w.version + 1 for w in weeks]))
+        return summary
+
+    try:
+        summary = writer.submit(archive)
+    except BaseException:
+        for done in written:  # the deletes rolled back: don't leave an archive of a live season
+            if os.path.exists(done):
+                os.remove(done)
+        raise
+    fragment_cache.clear()
+    week_states.clear()
+    with _standings_lock:
+        _standings = None
+    summary["path"] = path
+    return summary
+
+@app.get("/api/v1/archive")
+def api_archive_list():
+    return api_response({"seasons": [{"label": a.label, "weeks": len(a.header["weeks"]),
+                                      "created_at": a.header["created_at"]} for a in open_archives()]})
+
+@app.get("/api/v1/archive/<label>/standings")
+def api_archive_standings(label: str):
+    archive = next((a for a in open_archives() if a.label == label), None)
+    if archive is None:
+        abort(404, "Season not archived")
+    return api_response({"season": label, "standings": archive.standings()})
+
+@app.get("/api/v1/archive/head-to-head")
+def api_archive_head_to_head():
+    """Head-to-head across all archived seasons; ?a=&b= narrows to one pair."""
+    a, b = request.args.get("a"), request.args.get("b")
+    totals: Dict[Tuple[str, str], dict] = {}
+    for archive in open_archives():
+        for pair, row in archive.head_to_head().items():
+            if a and a not in pair or b and b not in pair:
+                continue
+            acc = totals.setdefault(pair, dict.fromkeys(row, 0))
+            for k, v in row.items():
+                acc[k] += v
+    return api_response({"pairs": [dict(player=x, opponent=y, **row) for (x, y), row in sorted(totals.items())]})
+
 # -------------------- Initialization helpers --------------------
 def parse_weeks_arg(weeks_arg: str, df: pd.DataFrame) -> List[int]:
     if weeks_arg.strip().lower() in ("all", "any"):
@@ -963,8 +2941,11 @@ def init_weeks_from_csv(csv_path: str, weeks: Iterable[int], players: List[str],
             db.query(Fixture).filter_by(week_id=wk.id).delete()
             wk.room_code = room_code
             wk.status = "drafting"
+            bump_week_versions(db, [wk.id], fixtures=True)
         else:
-            wk = Week(number=week_number, room_code=room_code, status="drafting")
+            floor = week_version_floor(db)
+            wk = Week(number=week_number, room_code=room_code, status="drafting",
+                      version=floor, fixtures_version=floor)
             db.add(wk)
             db.flush()
 
@@ -973,8 +2954,9 @@ def init_weeks_from_csv(csv_path: str, weeks: Iterable[int], players: List[str],
             db.add(Fixture(week_id=wk.id,
                            match_number=int(r["Match Number"]),
                            home=str(r["Home Team"]),
-                           away=str(r["Away Team"])))
-        db.commit()
+                           away=str(r["Away Team"]),
+                           kickoff=parse_kickoff(r.get("Date"))))
+        db.flush()
 
         # create 3 matchups for the week
         pls = db.query(Player).order_by(Player.name.asc()).all()
@@ -986,22 +2968,200 @@ def init_weeks_from_csv(csv_path: str, weeks: Iterable[int], players: List[str],
             b = db.query(Player).filter_by(name=b_name).first()
             first = random.choice([a, b])
             db.add(Matchup(week_id=wk.id, player_a_id=a.id, player_b_id=b.id, first_picker_id=first.id))
+        db.flush()
+        refresh_week_analytics(db, [wk.id])  # drop what the wiped week contributed
+        record_event(db, "WeekReinitialized", wk.id, week=week_number, fixtures=len(wkdf),
+                     matchups=[[m.id, m.player_a_id, m.player_b_id]
+                               for m in db.query(Matchup).filter_by(week_id=wk.id).order_by(Matchup.id.asc())])
+
+        # ensure initial status is set correctly; the wipe, new rows and event commit together
+        update_week_status(db, wk, commit=False)
         db.commit()
-
-        # ensure initial status is set correctly
-        update_week_status(db, wk)
+    reload_kickoffs()
+
+# -------------------- CSV fixture sync --------------------
+def read_fixture_rows(csv_path: str) -> Dict[int, dict]:
+    """CSV rows keyed by Match Number: round, teams and parsed UTC kickoff."""
+    df = pd.read_csv(csv_path, usecols=["Match Number", "Round Number", "Date", "Home Team", "Away Team"])
+    return {int(r["Match Number"]): {"week": int(r["Round Number"]), "home": str(r["Home Team"]),
+                                     "away": str(r["Away Team"]), "kickoff": parse_kickoff(r["Date"])}
+            for r in df.to_dict("records")}
+
+def remap_pick_team(team: str, old_home: str, old_away: str, new_home: str, new_away: str) -> str:
+    """Keep a pick on the same club if it is still in the fixture, else on the same side."""
+    if team in (new_home, new_away):
+        return team
+    return new_home if team == old_home else new_away if team == old_away else team
+
+def remap_result_outcome(outcome: str, old_home: str, old_away: str, new_home: str, new_away: str) -> str:
+    """Keep a result on the same winning club (Home<->Away when it changed side), like remap_pick_team."""
+    if outcome == "Draw":
+        return outcome
+    winner = remap_pick_team(old_home if outcome == "Home" else old_away, old_home, old_away, new_home, new_away)
+    return "Home" if winner == new_home else "Away"
+
+def apply_fixture_sync(db, rows: Dict[int, dict], weeks: Optional[Iterable[int]] = None) -> dict:
+    """Diff CSV rows against initialized weeks by Match Number and apply the changes (no commit).
+
+    * new match number in an initialized round -> fixture inserted (draftable straight away)
+    * round changed -> fixture moves; picks made on it in the old round are dropped, its result is kept
+    * round changed to one that isn't initialized -> fixture, its picks and result leave the old round
+    * teams / kickoff changed -> updated in place; picks and the result follow their club (or side,
+      for a renamed club), so a home/away swap flips a stored Home/Away result
+    Fixtures missing from the CSV are reported as orphaned and left alone. Matchups and
+    surviving picks are never touched, so a drafted week keeps its draft.
+    """
+    weeks_by_number = {w.number: w for w in db.query(Week)}
+    week_numbers = {w.id: n for n, w in weeks_by_number.items()}
+    scope = set(weeks) if weeks is not None else set(weeks_by_number)
+    existing = {f.match_number: f for f in db.query(Fixture).order_by(Fixture.id.asc())}
+
+    report = {"inserted": [], "moved": [], "updated": [], "removed": [], "orphaned": []}
+    touched: Dict[int, set] = {}   # week_id -> fixture ids whose picks/result the projection must re-read
+    removed: Dict[int, set] = {}   # week_id -> fixture ids that left the week
+    changed: set = set()           # week_ids whose rendered data moved (version bump)
+    drop_picks: List[int] = []
+    renamed: Dict[int, Tuple[str, str, str, str]] = {}
+    for number, row in sorted(rows.items()):
+        fx = existing.get(number)
+        if row["week"] not in scope and (fx is None or week_numbers[fx.week_id] not in scope):
+            continue
+        existing.pop(number, None)
+        target = weeks_by_number.get(row["week"])
+        if fx is None:
+            if target is not None:
+                fx = Fixture(week_id=target.id, match_number=number, home=row["home"], away=row["away"],
+                             kickoff=row["kickoff"])
+                db.add(fx)
+                db.flush()
+                touched.setdefault(target.id, set()).add(fx.id)
+                changed.add(target.id)
+                report["inserted"].append(number)
+            continue  # rounds that aren't initialized yet are init's job
+        if (fx.home, fx.away) != (row["home"], row["away"]):
+            renamed[fx.id] = (fx.home, fx.away, row["home"], row["away"])
+            fx.home, fx.away = row["home"], row["away"]
+            touched.setdefault(fx.week_id, set()).add(fx.id)
+            changed.add(fx.week_id)
+            report["updated"].append(number)
+        elif fx.kickoff != row["kickoff"]:
+            changed.add(fx.week_id)
+            report["updated"].append(number)
+        fx.kickoff = row["kickoff"]
+        if target is None or target.id != fx.week_id:
+            removed.setdefault(fx.week_id, set()).add(fx.id)
+            touched.get(fx.week_id, set()).discard(fx.id)
+            changed.add(fx.week_id)
+            drop_picks.append(fx.id)
+            report["moved" if target is not None else "removed"].append(
+                [number, week_numbers[fx.week_id], row["week"]])
+            if target is None:
+                db.query(Result).filter_by(fixture_id=fx.id).delete(synchronize_session=False)
+                db.delete(fx)
+            else:
+                fx.week_id = target.id
+                touched.setdefault(target.id, set()).add(fx.id)
+                changed.add(target.id)
+    report["orphaned"] = sorted(n for n, f in existing.items() if week_numbers[f.week_id] in scope)
+
+    if drop_picks:
+        db.query(Pick).filter(Pick.fixture_id.in_(drop_picks)).delete(synchronize_session=False)
+    if renamed:
+        for p in db.query(Pick).filter(Pick.fixture_id.in_(list(renamed))):
+            p.team = remap_pick_team(p.team, *renamed[p.fixture_id])
+        for res in db.query(Result).filter(Result.fixture_id.in_(list(renamed))):
+            outcome = remap_result_outcome(res.outcome, *renamed[res.fixture_id])
+            if outcome != res.outcome:
+                record_event(db, "ResultCorrected", res.fixture.week_id, fixture_id=res.fixture_id,
+                             outcome=outcome, previous=res.outcome)
+                res.outcome = outcome
+    db.flush()
+
+    report["weeks"] = sorted(week_numbers[wid] for wid in changed)
+    if not changed:
+        return report
+    bump_week_versions(db, changed, fixtures=True)
+
+    touched_ids = set().union(*touched.values()) if touched else set()
+    fixtures = {f.id: f for f in db.query(Fixture).filter(Fixture.id.in_(touched_ids))}
+    results = dict(db.query(Result.fixture_id, Result.outcome).filter(Result.fixture_id.in_(touched_ids)))
+    picks: Dict[int, list] = {}
+    for p in db.query(Pick).filter(Pick.fixture_id.in_(touched_ids)).order_by(Pick.id.asc()):
+        picks.setdefault(p.fixture_id, []).append([p.player_id, "Home" if p.team == fixtures[p.fixture_id].home else "Away"])
+    refresh_week_analytics(db, changed)
+    for wk in db.query(Week).filter(Week.id.in_(changed)):
+        update_week_status(db, wk, commit=False)
+        record_event(db, "FixturesSynced", wk.id, week=wk.number,
+                     fixtures=db.query(Fixture).filter_by(week_id=wk.id).count(),
+                     removed=sorted(removed.get(wk.id, ())),
+                     touched={str(fid): {"picks": picks.get(fid, []), "result": results.get(fid)}
+                              for fid in sorted(touched.get(wk.id, ()))})
+    return report
+
+def sync_fixtures_from_csv(csv_path: str, weeks: Optional[Iterable[int]] = None) -> dict:
+    """Apply a fixtures CSV to the initialized weeks in one transaction (see apply_fixture_sync)."""
+    rows = read_fixture_rows(csv_path)
+    report = writer.submit(lambda db: apply_fixture_sync(db, rows, weeks))
+    if report["weeks"]:
+        reload_kickoffs()
+    return report
+
+# -------------------- Background jobs --------------------
+BACKGROUND_JOBS = os.environ.get("BACKGROUND_JOBS", "1") == "1"  # 0 = this process never runs scheduled jobs
+_background_pid: Optional[int] = None
+_background_lock = threading.Lock()
+
+def start_background_jobs() -> None:
+    """Fill and start this process's scheduler once: kickoff locks, standings and read snapshots."""
+    global _background_pid
+    with _background_lock:
+        if _background_pid == os.getpid():
+            return
+        _background_pid = os.getpid()
+        if KICKOFF_LOCK and os.environ.get("KICKOFF_SCHEDULER", "1") == "1":
+            scheduler.load_from_db()
+            scheduler.schedule_in(KICKOFF_RELOAD_INTERVAL, kickoff_reload_job)
+        scheduler.schedule_in(SNAPSHOT_INTERVAL, standings_snapshot_job)
+        scheduler.schedule_in(0, read_snapshot_job)
+        scheduler.start()
+
+@app.before_request
+def ensure_background_jobs():
+    """Under gunicorn main() never runs: each worker starts its scheduler on its first request."""
+    if BACKGROUND_JOBS and _background_pid != os.getpid():
+        start_background_jobs()
 
 # -------------------- CLI --------------------
 def main():
     parser = argparse.ArgumentParser(description="Pick 'Em Flask + HTMX (tabs, multi-week, team-name picks)")
-    parser.add_argument("--csv", required=True, help="Path to fixtures CSV")
-    parser.add_argument("--weeks", required=True, help="Weeks to init: '1', '1-4', '1,3,8-10', or 'all'")
-    parser.add_argument("--players", required=True, help="Comma-separated 6 player names")
-    parser.add_argument("--room", required=True, help="Room code (shared password)")
+    parser.add_argument("--csv", help="Path to fixtures CSV")
+    parser.add_argument("--weeks", help="Weeks to init: '1', '1-4', '1,3,8-10', or 'all'")
+    parser.add_argument("--players", help="Comma-separated 6 player names")
+    parser.add_argument("--room", help="Room code (shared password)")
     parser.add_argument("--host", default="127.0.0.1")
     parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument("--archive", metavar="LABEL",
+                        help="Move the finalized season into ARCHIVE_DIR/LABEL.pka and exit")
+    parser.add_argument("--sync", action="store_true",
+                        help="Apply --csv fixture changes to initialized weeks (keeps picks) and exit")
     args = parser.parse_args()
 
+    if args.archive:
+        try:
+            print(archive_season(args.archive))
+        except ValueError as e:
+            print(f"Archive failed: {e}")
+        return
+    if args.sync:
+        if not args.csv:
+            parser.error("--sync requires --csv")
+        weeks = parse_weeks_arg(args.weeks, pd.read_csv(args.csv)) if args.weeks else None
+        print(json.dumps(sync_fixtures_from_csv(args.csv, weeks)))
+        return
+    missing = [f"--{n}" for n in ("csv", "weeks", "players", "room") if not getattr(args, n)]
+    if missing:
+        parser.error(f"the following arguments are required: {', '.join(missing)}")
+
     players = [p.strip() for p in args.players.split(",") if p.strip()]
     if len(players) != 6:
         print("Please supply exactly 6 players.")
@@ -1019,6 +3179,9 @@ def main():
 
     app.jinja_env.globals.update(zip=zip)
 
+    if BACKGROUND_JOBS:
+        start_background_jobs()
+
     # Stable run (no reloader); enable threading for concurrency
     app.run(host=args.host, port=args.port, debug=False, use_reloader=False, threaded=True)
 
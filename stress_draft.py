@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""Draft-night stress harness for pickem_flask_htmx_tabs.
+
+Starts the app against a throwaway SQLite file (threaded dev server or gunicorn workers),
+initializes one week per simulated league and then, concurrently:
+  * two players per matchup alternate POST /pick following the server's snake order,
+  * readers hammer GET /partials/matchups/<week>,
+  * result writers POST /set_result on random fixtures.
+At the end it reports throughput, p50/p99 latency per operation, lock errors and
+invariant violations (duplicate or out-of-turn picks) read back from the database.
+
+  python stress_draft.py --mode threaded --leagues 6
+  python stress_draft.py --mode workers --workers 4 --threads 4 --leagues 10 --readers 16
+"""
+import argparse
+import http.cookiejar
+import json
+import os
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from typing import Dict, List, Optional
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PLAYERS = ["Ana", "Ben", "Cat", "Dan", "Eve", "Fin"]
+ROOM = "stress"
+
+
+# -------------------- Server lifecycle --------------------
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def server_env(workdir: str) -> dict:
+    env = dict(os.environ)
+    env.update({
+        "DB_PATH": f"sqlite:///{os.path.join(workdir, 'stress.db')}",
+        "KICKOFF_LOCK": "0",          # historical fixtures would otherwise all be locked
+        "KICKOFF_SCHEDULER": "0",
+        "PYTHONPATH": HERE + os.pathsep + env.get("PYTHONPATH", ""),
+    })
+    return env
+
+def init_db(workdir: str, csv_path: str, leagues: int) -> None:
+    code = ("import pickem_flask_htmx_tabs as m; "
+            f"m.init_weeks_from_csv({csv_path!r}, range(1, {leagues} + 1), {PLAYERS!r}, {ROOM!r})")
+    subprocess.run([sys.executable, "-c", code], cwd=workdir, env=server_env(workdir), check=True)
+
+def start_server(args, workdir: str, port: int, log) -> subprocess.Popen:
+    if args.mode == "threaded":
+        cmd = [sys.executable, "-c",
+               "import pickem_flask_htmx_tabs as m; "
+               f"m.app.run(host='127.0.0.1', port={port}, threaded=True, use_reloader=False)"]
+    else:
+        cmd = [sys.executable, "-m", "gunicorn", "-w", str(args.workers), "--threads", str(args.threads),
+               "-b", f"127.0.0.1:{port}", "--pythonpath", HERE, "pickem_flask_htmx_tabs:app"]
+    proc = subprocess.Popen(cmd, cwd=workdir, env=server_env(workdir), stdout=log, stderr=subprocess.STDOUT)
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return proc
+        except OSError:
+            if proc.poll() is not None:
+                raise SystemExit("Server exited during startup; see server.log")
+            time.sleep(0.2)
+    proc.kill()
+    raise SystemExit("Server did not start within 30s")
+
+
+# -------------------- HTTP client + metrics --------------------
+class Metrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latency: Dict[str, List[float]] = {}
+        self.errors: Dict[str, Dict[str, int]] = {}
+
+    def record(self, op: str, seconds: float, error: Optional[str] = None) -> None:
+        with self._lock:
+            self.latency.setdefault(op, []).append(seconds)
+            if error:
+                bucket = self.errors.setdefault(op, {})
+                bucket[error] = bucket.get(error, 0) + 1
+
+class Client:
+    """One simulated browser: its own cookie jar (and so its own Flask session)."""
+
+    def __init__(self, base: str, metrics: Metrics, timeout: float):
+        self.base = base
+        self.metrics = metrics
+        self.timeout = timeout
+        self.opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar()))
+
+    def call(self, op: str, path: str, form: Optional[dict] = None):
+        data = urllib.parse.urlencode(form).encode() if form is not None else None
+        started = time.perf_counter()
+        try:
+            with self.opener.open(self.base + path, data=data, timeout=self.timeout) as resp:
+                body = resp.read()
+            self.metrics.record(op, time.perf_counter() - started)
+            return 200, body
+        except urllib.error.HTTPError as e:
+            body = e.read()
+            self.metrics.record(op, time.perf_counter() - started, f"http {e.code}")
+            return e.code, body
+        except (urllib.error.URLError, socket.timeout, ConnectionError) as e:
+            self.metrics.record(op, time.perf_counter() - started, type(e).__name__)
+            return None, b""
+
+    def join(self, name: str) -> None:
+        self.call("join", "/join", {"name": name, "room_code": ROOM})
+
+
+# -------------------- Simulated actors --------------------
+def drafter(base, metrics, args, week: int, matchup_id: int, name: str, player_id: int, stop: threading.Event):
+    """Poll the board; whenever the server says it's this player's turn, pick the first open game."""
+    client = Client(base, metrics, args.timeout)
+    client.join(name)
+    while not stop.is_set():
+        status, body = client.call("board", f"/api/v1/weeks/{week}/board?fields=matchups")
+        if status != 200:
+            time.sleep(0.05)
+            continue
+        m = next(x for x in json.loads(body)["matchups"] if x["id"] == matchup_id)
+        if not m["available"]:
+            return
+        if m["turn_id"] != player_id:
+            time.sleep(args.think)
+            continue
+        fx = m["available"][0]
+        client.call("pick", "/pick", {"week": week, "matchup_id": matchup_id, "fixture_id": fx["id"],
+                                      "team": random.choice([fx["home"], fx["away"]])})
+
+def reader(base, metrics, args, weeks: List[int], stop: threading.Event):
+    client = Client(base, metrics, args.timeout)
+    client.join(PLAYERS[0])
+    while not stop.is_set():
+        client.call("matchups", f"/partials/matchups/{random.choice(weeks)}")
+
+def result_writer(base, metrics, args, fixtures: List[tuple], stop: threading.Event):
+    client = Client(base, metrics, args.timeout)
+    while not stop.is_set():
+        week, fixture_id, home, away = random.choice(fixtures)
+        client.call("set_result", "/set_result",
+                    {"week": week, "fixture_id": fixture_id, "outcome": random.choice([home, away, "Draw"])})
+        time.sleep(args.result_interval)
+
+
+# -------------------- Invariants + report --------------------
+def check_invariants(m) -> Dict[str, int]:
+    """Re-read every pick and replay each matchup's snake order."""
+    db = m.SessionLocal()
+    violations = {"duplicate_picks": 0, "out_of_turn_picks": 0, "picks_total": 0}
+    for mu in db.query(m.Matchup).all():
+        picks = (db.query(m.Pick).filter_by(matchup_id=mu.id)
+                 .order_by(m.Pick.created_at.asc(), m.Pick.id.asc()).all())
+        violations["picks_total"] += len(picks)
+        seen = set()
+        for i, p in enumerate(picks):
+            if p.fixture_id in seen:
+                violations["duplicate_picks"] += 1
+            seen.add(p.fixture_id)
+            if p.player_id != m.turn_after(mu, i):
+                violations["out_of_turn_picks"] += 1
+    m.SessionLocal.remove()
+    return violations
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))] if ordered else 0.0
+
+def report(metrics: Metrics, elapsed: float, invariants: Dict[str, int], locked_in_log: int) -> dict:
+    ops = {}
+    for op, lat in sorted(metrics.latency.items()):
+        errs = metrics.errors.get(op, {})
+        ops[op] = {"requests": len(lat), "rps": round(len(lat) / elapsed, 1),
+                   "p50_ms": round(percentile(lat, 0.50) * 1000, 1),
+                   "p99_ms": round(percentile(lat, 0.99) * 1000, 1),
+                   "errors": errs}
+    return {"elapsed_s": round(elapsed, 2), "ops": ops,
+            "database_locked_in_server_log": locked_in_log, "invariants": invariants}
+
+def print_report(rep: dict) -> None:
+    print(f"\nElapsed: {rep['elapsed_s']}s")
+    print(f"{'op':<12}{'requests':>10}{'req/s':>9}{'p50 ms':>9}{'p99 ms':>9}  errors")
+    for op, r in rep["ops"].items():
+        errs = ", ".join(f"{k}: {v}" for k, v in r["errors"].items()) or "-"
+        print(f"{op:<12}{r['requests']:>10}{r['rps']:>9}{r['p50_ms']:>9}{r['p99_ms']:>9}  {errs}")
+    print(f"'database is locked' in server log: {rep['database_locked_in_server_log']}")
+    inv = rep["invariants"]
+    print(f"Picks: {inv['picks_total']}  duplicate: {inv['duplicate_picks']}  out-of-turn: {inv['out_of_turn_picks']}")
+
+
+# -------------------- CLI --------------------
+def main():
+    parser = argparse.ArgumentParser(description="Simulate concurrent draft nights against SQLite")
+    parser.add_argument("--mode", choices=["threaded", "workers"], default="threaded",
+                        help="Flask threaded dev server or gunicorn multi-worker")
+    parser.add_argument("--workers", type=int, default=4, help="gunicorn workers (workers mode)")
+    parser.add_argument("--threads", type=int, default=4, help="threads per gunicorn worker")
+    parser.add_argument("--leagues", type=int, default=6, help="Leagues drafting at once (one week each)")
+    parser.add_argument("--readers", type=int, default=8, help="Threads polling /partials/matchups")
+    parser.add_argument("--result-writers", type=int, default=2, help="Threads posting /set_result")
+    parser.add_argument("--result-interval", type=float, default=0.05, help="Seconds between result posts")
+    parser.add_argument("--think", type=float, default=0.02, help="Drafter poll delay when not its turn")
+    parser.add_argument("--duration", type=float, default=120, help="Hard stop in seconds")
+    parser.add_argument("--timeout", type=float, default=30, help="Per-request timeout")
+    parser.add_argument("--csv", default=os.path.join(HERE, "epl_2025.csv"))
+    parser.add_argument("--json", dest="json_out", help="Also write the report as JSON to this path")
+    parser.add_argument("--keep", action="store_true", help="Keep the temp dir (DB + server.log)")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="pickem-stress-")
+    init_db(workdir, args.csv, args.leagues)
+    # The harness reads the same DB for setup data and the final invariant check
+    os.environ.update({k: v for k, v in server_env(workdir).items() if k in ("DB_PATH", "KICKOFF_LOCK")})
+    os.chdir(workdir)
+    sys.path.insert(0, HERE)
+    import pickem_flask_htmx_tabs as m
+
+    db = m.SessionLocal()
+    weeks = list(range(1, args.leagues + 1))
+    week_rows = {w.id: w.number for w in db.query(m.Week).filter(m.Week.number.in_(weeks))}
+    names = {p.id: p.name for p in db.query(m.Player).all()}
+    matchups = [(week_rows[mu.week_id], mu.id, mu.player_a_id, mu.player_b_id)
+                for mu in db.query(m.Matchup).filter(m.Matchup.week_id.in_(week_rows))]
+    fixtures = [(week_rows[f.week_id], f.id, f.home, f.away)
+                for f in db.query(m.Fixture).filter(m.Fixture.week_id.in_(week_rows))]
+    m.SessionLocal.remove()
+
+    port = free_port()
+    base = f"http://127.0.0.1:{port}"
+    log_path = os.path.join(workdir, "server.log")
+    metrics = Metrics()
+    stop = threading.Event()
+    with open(log_path, "wb") as log:
+        proc = start_server(args, workdir, port, log)
+        try:
+            drafters = [threading.Thread(target=drafter, args=(base, metrics, args, wk, mid, names[pid], pid, stop))
+                        for wk, mid, a, b in matchups for pid in (a, b)]
+            background = ([threading.Thread(target=reader, args=(base, metrics, args, weeks, stop))
+                           for _ in range(args.readers)] +
+                          [threading.Thread(target=result_writer, args=(base, metrics, args, fixtures, stop))
+                           for _ in range(args.result_writers)])
+            print(f"{args.mode}: {args.leagues} leagues, {len(drafters)} drafters, {args.readers} readers, "
+                  f"{args.result_writers} result writers -> {base}")
+            started = time.perf_counter()
+            for t in drafters + background:
+                t.daemon = True
+                t.start()
+            deadline = started + args.duration
+            for t in drafters:
+                t.join(timeout=max(0.0, deadline - time.perf_counter()))
+            stop.set()
+            elapsed = time.perf_counter() - started
+            for t in background:
+                t.join(timeout=args.timeout)
+        finally:
+            proc.terminate()
+            proc.wait(timeout=10)
+
+    with open(log_path, "rb") as fh:
+        locked = fh.read().count(b"database is locked")
+    rep = report(metrics, elapsed, check_invariants(m), locked)
+    print_report(rep)
+    if args.json_out:
+        with open(args.json_out, "w") as fh:
+            json.dump(rep, fh, indent=2)
+    if args.keep:
+        print(f"Artifacts kept in {workdir}")
+    else:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
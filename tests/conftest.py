@@ -0,0 +1,70 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+# The app binds its engine and runtime directories at import time: point them at a scratch dir first.
+WORKDIR = tempfile.mkdtemp(prefix="pickem-tests-")
+os.environ.update({
+    "DB_PATH": f"sqlite:///{os.path.join(WORKDIR, 'pickem.db')}",
+    "KICKOFF_LOCK": "0",
+    "KICKOFF_SCHEDULER": "0",
+    "BACKGROUND_JOBS": "0",
+    "READ_SNAPSHOT_DIR": os.path.join(WORKDIR, "snapshots"),
+    "PROFILE_DIR": os.path.join(WORKDIR, "profiles"),
+    "ARCHIVE_DIR": os.path.join(WORKDIR, "archives"),
+})
+os.chdir(WORKDIR)  # flask-session writes ./flask_session
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pickem_flask_htmx_tabs as m  # noqa: E402
+
+CSV = os.path.join(ROOT, "epl_2025.csv")
+PLAYERS = ["A", "B", "C", "D", "E", "F"]
+
+
+@pytest.fixture
+def app_module():
+    """Fresh weeks 1-2 with empty in-process caches and projection."""
+    db = m.SessionLocal()
+    for model in (m.Pick, m.Result, m.Matchup, m.Fixture, m.Event, m.StandingsSnapshot, m.AnalyticsWeek,
+                  m.AnalyticsPair, m.AnalyticsTeam, m.AnalyticsSide, m.Week):
+        db.query(model).delete()
+    db.commit()
+    m.SessionLocal.remove()
+    m.fragment_cache.clear()
+    m.week_states.clear()
+    m._standings = None
+    m.init_weeks_from_csv(CSV, [1, 2], PLAYERS, "room")
+    yield m
+    m.SessionLocal.remove()
+
+
+@pytest.fixture
+def client(app_module):
+    return app_module.app.test_client()
+
+
+def week(db, number):
+    return db.query(m.Week).filter_by(number=number).first()
+
+
+def draft(db, wk, picks_per_matchup):
+    """Commit picks in snake order, each matchup taking fixtures in match order."""
+    fixtures = db.query(m.Fixture).filter_by(week_id=wk.id).order_by(m.Fixture.match_number).all()
+    for mu in db.query(m.Matchup).filter_by(week_id=wk.id).order_by(m.Matchup.id):
+        for i in range(picks_per_matchup):
+            fx = fixtures[i]
+            db.add(m.Pick(matchup_id=mu.id, player_id=m.turn_after(mu, i), fixture_id=fx.id,
+                          team=fx.home if i % 2 else fx.away))
+    m.bump_week_versions(db, [wk.id])
+    db.commit()
+
+
+def finalize(db, wk):
+    """Set a result on every fixture of `wk` and let it finalize."""
+    fixtures = db.query(m.Fixture).filter_by(week_id=wk.id).all()
+    m.upsert_results(db, {f.id: ("Home", "Away", "Draw")[f.id % 3] for f in fixtures})
+    m.update_week_status(db, wk)
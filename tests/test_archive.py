@@ -0,0 +1,78 @@
+import os
+import sqlite3
+
+import pytest
+
+from conftest import CSV, PLAYERS, draft, finalize, week
+
+
+def test_server_caches_survive_an_archive_done_by_another_process(app_module, client, monkeypatch):
+    m = app_module
+    db = m.SessionLocal()
+    for n in (1, 2):
+        draft(db, week(db, n), 4)
+        finalize(db, week(db, n))
+    old = week(db, 1)
+    old_version = old.version
+    old_fixtures = client.get("/partials/fixtures/1").data
+    assert client.get("/api/v1/season").status_code == 200
+    server_projection = m._standings
+    assert server_projection.totals()
+
+    # The CLI's in-process resets never reach a running server: keep this process's caches as they are
+    monkeypatch.setattr(m.fragment_cache, "clear", lambda: None)
+    monkeypatch.setattr(m.week_states, "clear", lambda: None)
+    m.archive_season("s1")
+    m._standings = server_projection
+
+    m.init_weeks_from_csv(CSV, [3], PLAYERS, "room")
+    m.SessionLocal.rollback()
+    new = week(db, 3)
+    assert new.version > old_version  # (id, version) keys can't collide even where ids are reused
+    html = client.get("/partials/fixtures/3").data
+    assert html != old_fixtures
+    first = db.query(m.Fixture).filter_by(week_id=new.id).order_by(m.Fixture.match_number).first()
+    assert first.home.encode() in html.replace(b"&#39;", b"'")
+
+    assert m.season_standings(db) == {}  # the hot projection saw SeasonArchived
+    assert m.rebuild_standings(db).totals() == {}
+
+
+def test_archive_holds_the_write_lock_from_first_read_to_last_delete(app_module, monkeypatch):
+    m = app_module
+    db = m.SessionLocal()
+    for n in (1, 2):
+        draft(db, week(db, n), 2)
+        finalize(db, week(db, n))
+    write = m.write_season_archive
+    blocked = []
+
+    def write_then_race(wdb, path, label):
+        summary = write(wdb, path, label)
+        other = sqlite3.connect(m.engine.url.database, timeout=0.05)  # e.g. the running server
+        with pytest.raises(sqlite3.OperationalError, match="locked"):
+            other.execute("INSERT INTO players (name) VALUES ('late')")
+        other.close()
+        blocked.append(True)
+        return summary
+
+    monkeypatch.setattr(m, "write_season_archive", write_then_race)
+    m.archive_season("locked")
+    assert blocked
+
+
+def test_failed_archive_keeps_the_season_and_removes_the_file(app_module, monkeypatch):
+    m = app_module
+    db = m.SessionLocal()
+    for n in (1, 2):
+        draft(db, week(db, n), 2)
+        finalize(db, week(db, n))
+
+    def fail(*a, **k):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(m, "week_version_floor", fail)  # after the file is written, before commit
+    with pytest.raises(RuntimeError):
+        m.archive_season("broken")
+    assert not os.path.exists(os.path.join(m.ARCHIVE_DIR, "broken.pka"))
+    assert m.SessionLocal().query(m.Week).count() == 2
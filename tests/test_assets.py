@@ -0,0 +1,12 @@
+import brotli
+
+
+def test_assets_are_served_brotli_when_accepted(app_module, client):
+    m = app_module
+    m.load_assets()  # brotli is a requirement: every asset gets a br body
+    with m.app.test_request_context():
+        url = m.asset_url("pickem.css")
+    r = client.get(url, headers={"Accept-Encoding": "gzip, br"})
+    assert r.headers["Content-Encoding"] == "br"
+    assert brotli.decompress(r.data) == m.ASSETS["pickem.css"]["bodies"]["identity"]
+    assert client.get(url, headers={"Accept-Encoding": "gzip"}).headers["Content-Encoding"] == "gzip"
@@ -0,0 +1,27 @@
+import io
+
+from conftest import CSV, week
+
+
+def test_fixtures_csv_with_scores_is_accepted(app_module, client):
+    m = app_module
+    df = m.pd.read_csv(CSV)
+    round1 = df["Round Number"] == 1
+    numbers = df.loc[round1, "Match Number"].tolist()
+    df["Result"] = df["Result"].astype(object)
+    df.loc[df["Match Number"] == numbers[0], "Result"] = "2 - 1"
+    df.loc[df["Match Number"] == numbers[1], "Result"] = "0 - 3"
+    df.loc[df["Match Number"] == numbers[2], "Result"] = "1-1"
+    df.loc[df["Match Number"] == numbers[3], "Result"] = "two nil"
+    body = df[round1].to_csv(index=False)
+    with client.session_transaction() as s:
+        s[m.ADMIN_SESSION_KEY] = True
+
+    r = client.post("/admin/results/bulk", data={"file": (io.BytesIO(body.encode()), "epl.csv")})
+    data = r.get_json()
+    assert (data["accepted"], data["rejected"], data["skipped"]) == (3, 1, len(numbers) - 4)
+
+    db = m.SessionLocal()
+    by_number = dict(db.query(m.Fixture.match_number, m.Result.outcome).join(m.Result, m.Result.fixture_id == m.Fixture.id)
+                     .filter(m.Fixture.week_id == week(db, 1).id))
+    assert by_number == {numbers[0]: "Home", numbers[1]: "Away", numbers[2]: "Draw"}
@@ -0,0 +1,74 @@
+from conftest import CSV, draft, finalize, week
+
+
+def sync(m, edit):
+    rows = m.read_fixture_rows(CSV)
+    edit(rows)
+    return m.writer.submit(lambda db: m.apply_fixture_sync(db, rows, [1, 2]))
+
+
+def first_fixture(m, db, number):
+    return db.query(m.Fixture).filter_by(week_id=week(db, number).id).order_by(m.Fixture.match_number).first()
+
+
+def scores(m, db):
+    return m.season_standings(db), m.StandingsProjection(m.projection_state_from_tables(db)).totals()
+
+
+def test_move_drops_picks_and_keeps_the_result(app_module):
+    m = app_module
+    db = m.SessionLocal()
+    draft(db, week(db, 1), 2)
+    fx = first_fixture(m, db, 1)
+    m.upsert_results(db, {fx.id: "Home"})
+    db.commit()
+    number, fx_id = fx.match_number, fx.id
+
+    report = sync(m, lambda rows: rows[number].update(week=2))
+    db = m.SessionLocal()
+    assert report["moved"] == [[number, 1, 2]]
+    assert db.get(m.Fixture, fx_id).week_id == week(db, 2).id
+    assert db.query(m.Pick).filter_by(fixture_id=fx_id).count() == 0
+    assert db.query(m.Result.outcome).filter_by(fixture_id=fx_id).scalar() == "Home"
+
+
+def test_rename_keeps_picks_and_result_on_their_side(app_module):
+    m = app_module
+    db = m.SessionLocal()
+    draft(db, week(db, 1), 2)
+    fx = first_fixture(m, db, 1)
+    m.upsert_results(db, {fx.id: "Home"})
+    db.commit()
+    number, fx_id, home = fx.match_number, fx.id, fx.home
+    sides = sorted(("Home" if p.team == fx.home else "Away") for p in db.query(m.Pick).filter_by(fixture_id=fx.id))
+
+    report = sync(m, lambda rows: rows[number].update(home=home + " FC"))
+    db = m.SessionLocal()
+    fx = db.get(m.Fixture, fx_id)
+    assert report["updated"] == [number] and fx.home == home + " FC"
+    assert sorted(("Home" if p.team == fx.home else "Away") for p in db.query(m.Pick).filter_by(fixture_id=fx_id)) == sides
+    assert db.query(m.Result.outcome).filter_by(fixture_id=fx_id).scalar() == "Home"
+
+
+def test_swap_keeps_picks_and_result_on_their_club(app_module):
+    m = app_module
+    db = m.SessionLocal()
+    draft(db, week(db, 1), 2)
+    finalize(db, week(db, 1))
+    db.commit()
+    fx = first_fixture(m, db, 1)
+    m.upsert_results(db, {fx.id: "Home"})
+    db.commit()
+    number, fx_id, home, away = fx.match_number, fx.id, fx.home, fx.away
+    teams = sorted(p.team for p in db.query(m.Pick).filter_by(fixture_id=fx.id))
+    before = scores(m, db)
+
+    sync(m, lambda rows: rows[number].update(home=away, away=home))
+    db = m.SessionLocal()
+    fx = db.get(m.Fixture, fx_id)
+    assert (fx.home, fx.away) == (away, home)
+    assert sorted(p.team for p in db.query(m.Pick).filter_by(fixture_id=fx_id)) == teams
+    assert db.query(m.Result.outcome).filter_by(fixture_id=fx_id).scalar() == "Away"  # the same club won
+    ev = db.query(m.Event).filter_by(kind="ResultCorrected").order_by(m.Event.id.desc()).first()
+    assert m.msgspec.json.decode(ev.payload) == {"fixture_id": fx_id, "outcome": "Away", "previous": "Home"}
+    assert scores(m, db) == before
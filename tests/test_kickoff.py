@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta
+
+from conftest import CSV, PLAYERS, week
+
+
+def test_kickoff_job_bumps_week_and_refreshes_cached_state(app_module):
+    m = app_module
+    db = m.SessionLocal()
+    wk = week(db, 1)
+    fx = db.query(m.Fixture).filter_by(week_id=wk.id).order_by(m.Fixture.match_number).first()
+    state = m.week_states.get(wk)
+    before, fx_id = wk.version, fx.id
+
+    m.kickoff_boundary_job(fx.kickoff)  # runs on the scheduler thread in production; removes the session
+    db = m.SessionLocal()
+
+    wk = week(db, 1)
+    assert wk.version == before + 1
+    assert m.week_states.get(wk) is not state
+    ev = db.query(m.Event).filter_by(kind="FixturesLocked").one()
+    assert ev.week_id == wk.id and fx_id in m.msgspec.json.decode(ev.payload)["fixture_ids"]
+
+
+def test_schedule_follows_init_and_sync(app_module, monkeypatch, tmp_path):
+    m = app_module
+    monkeypatch.setattr(m.scheduler, "_heap", [])
+    monkeypatch.setattr(m.scheduler, "kickoffs_loaded", False)
+    db = m.SessionLocal()
+    future = datetime.utcnow() + timedelta(days=2)
+    fx = db.query(m.Fixture).filter_by(week_id=week(db, 1).id).first()
+    fx.kickoff = future.replace(microsecond=0)
+    db.commit()
+    m.scheduler.load_from_db()
+    jobs = lambda: sorted(args[0] for _, _, fn, args in m.scheduler._heap if fn is m.kickoff_boundary_job)
+    assert jobs() == [fx.kickoff]
+
+    # --sync in this process moves the kickoff: the job moves with it
+    df = m.pd.read_csv(CSV)
+    later = future + timedelta(hours=3)
+    local = later.replace(tzinfo=m.timezone.utc).astimezone(m.FIXTURES_TZ)
+    df.loc[df["Match Number"] == fx.match_number, "Date"] = local.strftime("%d/%m/%Y %H:%M")
+    path = tmp_path / "fixtures.csv"
+    df.to_csv(path, index=False)
+    m.sync_fixtures_from_csv(str(path), [1, 2])
+    assert jobs() == [later.replace(second=0, microsecond=0)]
+
+    # another process re-initializes: the recurring reload notices the new event
+    monkeypatch.setattr(m.scheduler, "schedule_in", lambda *a, **k: None)
+    monkeypatch.setattr(m.scheduler, "kickoffs_loaded", False)  # as if init ran elsewhere
+    m.init_weeks_from_csv(CSV, [1], PLAYERS, "room")
+    assert jobs() == [later.replace(second=0, microsecond=0)]
+    m.kickoff_reload_job()
+    assert jobs() == []
+
+
+def test_first_request_starts_the_scheduler_once_per_process(app_module, client, monkeypatch):
+    m = app_module
+    started = []
+    monkeypatch.setattr(m, "BACKGROUND_JOBS", True)
+    monkeypatch.setattr(m, "_background_pid", None)
+    monkeypatch.setattr(m.scheduler, "_heap", [])
+    monkeypatch.setattr(m.scheduler, "start", lambda: started.append(True))
+
+    client.get("/api/v1/season")
+    client.get("/api/v1/season")
+    assert started == [True]
+    assert {fn for _, _, fn, _ in m.scheduler._heap} >= {m.standings_snapshot_job, m.read_snapshot_job}
+
+    monkeypatch.setattr(m, "_background_pid", -1)  # as seen from a worker forked after the first start
+    client.get("/api/v1/season")
+    assert started == [True, True]
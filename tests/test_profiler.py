@@ -0,0 +1,24 @@
+import os
+
+
+def sample(profiler, rule):
+    handle = profiler.start()
+    sum(range(1000))
+    profiler.stop(handle, "GET", rule, rule)
+
+
+def test_restarted_profiler_lists_and_rotates_earlier_runs_files(app_module, tmp_path):
+    m = app_module
+    directory = str(tmp_path)
+    first = m.RequestProfiler({"*": 1.0}, directory, 2, 0.001)
+    sample(first, "/tab/current")
+    sample(first, "/tab/season")
+
+    restarted = m.RequestProfiler({"*": 1.0}, directory, 2, 0.001)
+    assert sorted(s["route"] for s in restarted.slowest()) == ["tab_current", "tab_season"]
+    assert all(s["top"] for s in restarted.slowest())
+
+    sample(restarted, "/api/v1/season")
+    names = sorted(f.rsplit(".", 1)[0] for f in os.listdir(directory))
+    assert len(set(names)) == 2 and not any("tab_current" in n for n in names)
+    assert sorted(s["route"] for s in restarted.slowest()) == ["/api/v1/season", "tab_season"]
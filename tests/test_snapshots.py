@@ -0,0 +1,33 @@
+import re
+import stat
+
+from conftest import draft, finalize, week
+
+
+def test_season_api_reports_standings_and_weeks_from_the_same_snapshot(app_module, client, monkeypatch, tmp_path):
+    m = app_module
+    monkeypatch.setattr(m, "read_snapshots", m.ReadSnapshots(str(tmp_path)))
+    path = m.read_snapshots.take()  # before anything is drafted
+    assert stat.S_IMODE(tmp_path.joinpath(path).stat().st_mode) == 0o600
+
+    db = m.SessionLocal()
+    draft(db, week(db, 1), 4)
+    finalize(db, week(db, 1))
+    live = m.season_standings(db)
+    assert any(t["net"] for t in live.values())
+
+    r = client.get("/api/v1/season")
+    assert r.headers["X-Data-As-Of"] != "live"
+    body = r.get_json()
+    assert all(row["for"] == row["against"] == 0 for row in body["standings"])
+    assert all(not any(w["points"].values()) for w in body["weeks"])
+    tab = client.get("/tab/season")
+    assert b"As of" in tab.data and tab.headers["X-Data-As-Of"] == r.headers["X-Data-As-Of"]
+    totals = tab.data.split(b'id="season-totals"')[1].split(b"</table>")[0]
+    assert set(re.findall(rb"<td>(-?\d+)</td>", totals)) == {b"0"}  # the snapshot's totals, not the live ones
+
+    m.read_snapshots.take()
+    body = client.get("/api/v1/season").get_json()
+    nets = {p.name: live.get(p.id, {}).get("net", 0) for p in db.query(m.Player)}
+    assert {row["name"]: row["net"] for row in body["standings"]} == nets
+    assert any(body["weeks"][0]["points"].values())
@@ -0,0 +1,69 @@
+from conftest import finalize, week
+
+
+def test_first_season_read_seeds_the_snapshot_through_the_writer(app_module, client):
+    m = app_module
+    jobs = m.writer.jobs
+    assert client.get("/api/v1/season").status_code == 200
+    db = m.SessionLocal()
+    assert db.query(m.StandingsSnapshot).count() == 1
+    assert m.writer.jobs == jobs + 1
+
+
+def test_snapshot_job_writes_through_the_writer(app_module, monkeypatch):
+    m = app_module
+    monkeypatch.setattr(m, "SNAPSHOT_EVERY", 2)
+    monkeypatch.setattr(m.scheduler, "schedule_in", lambda *a, **k: None)
+    m.standings_snapshot_job()  # seeds
+    db = m.SessionLocal()
+    for _ in range(2):
+        m.record_event(db, "Noop", week(db, 1).id)
+    db.commit()
+    jobs = m.writer.jobs
+    m.standings_snapshot_job()
+    snaps = db.query(m.StandingsSnapshot.event_offset).order_by(m.StandingsSnapshot.event_offset).all()
+    assert len(snaps) == 2 and snaps[-1][0] == m.latest_event_offset(db)
+    assert m.writer.jobs == jobs + 1
+
+
+def reference_totals(m, db):
+    """Season totals the slow way: Week.status == "finalized" weeks, each player's for/against per matchup."""
+    weeks = db.query(m.Week).filter_by(status="finalized").all()
+    points = m.weekly_points_for_weeks(db, weeks)
+    totals = {}
+    for wk in weeks:
+        for mu in db.query(m.Matchup).filter_by(week_id=wk.id):
+            for me, them in ((mu.player_a_id, mu.player_b_id), (mu.player_b_id, mu.player_a_id)):
+                t = totals.setdefault(me, {"for": 0, "against": 0})
+                t["for"] += points[wk.id][me]
+                t["against"] += points[wk.id][them]
+    return {pid: dict(t, net=t["for"] - t["against"]) for pid, t in totals.items()}
+
+
+def test_projection_matches_finalized_status(app_module, client):
+    m = app_module
+    db = m.SessionLocal()
+    assert m.season_standings(db) == {}  # seeded before any picks: the rest arrives as events
+    for n in (1, 2):
+        wk = week(db, n)
+        fixtures = db.query(m.Fixture).filter_by(week_id=wk.id).order_by(m.Fixture.match_number).all()
+        for mu in db.query(m.Matchup).filter_by(week_id=wk.id).all():
+            for i, fx in enumerate(fixtures[:4]):
+                with client.session_transaction() as s:
+                    s["player_name"] = db.get(m.Player, m.compute_next_turn(db, mu)).name
+                team = fx.home if (mu.id + i) % 2 else fx.away
+                assert client.post("/pick", data={"week": n, "matchup_id": mu.id, "fixture_id": fx.id,
+                                                  "team": team}).status_code == 200
+        m.SessionLocal.rollback()
+    finalize(db, week(db, 1))
+    wk2 = week(db, 2)
+    fixtures = db.query(m.Fixture).filter_by(week_id=wk2.id).all()
+    m.upsert_results(db, {f.id: "Home" for f in fixtures[:-1]})  # week 2 stays provisional
+    m.update_week_status(db, wk2)
+    m.SessionLocal.rollback()
+
+    assert week(db, 1).status == "finalized" and week(db, 2).status != "finalized"
+    expected = reference_totals(m, db)
+    assert any(t["net"] for t in expected.values())
+    assert m.season_standings(db) == expected
+    assert m.StandingsProjection(m.projection_state_from_tables(db)).totals() == expected
@@ -0,0 +1,135 @@
+from types import SimpleNamespace
+
+from conftest import week
+
+
+def commit_pick(m, wk_id, matchup, fixture):
+    """What make_pick's writer job does: insert, bump the version, hand back (version, PickRec)."""
+    def write(wdb):
+        mu = wdb.get(m.Matchup, matchup)
+        fx = wdb.get(m.Fixture, fixture)
+        pick = m.Pick(matchup_id=mu.id, player_id=m.compute_next_turn(wdb, mu), fixture_id=fx.id, team=fx.home)
+        wdb.add(pick)
+        m.bump_week_versions(wdb, [wk_id])
+        wdb.flush()
+        version = wdb.query(m.Week.version).filter_by(id=wk_id).scalar()
+        return version, m.PickRec(pick.id, mu.id, pick.player_id, fx.id, fx.home, pick.created_at)
+    return m.writer.submit(write)
+
+
+def test_state_loaded_after_a_pick_with_a_stale_week_row_is_not_patched_twice(app_module):
+    m = app_module
+    db = m.SessionLocal()
+    wk = week(db, 1)
+    mu = db.query(m.Matchup).filter_by(week_id=wk.id).order_by(m.Matchup.id).first()
+    fx = db.query(m.Fixture).filter_by(week_id=wk.id).order_by(m.Fixture.match_number).first()
+    stale = SimpleNamespace(id=wk.id, version=wk.version)  # a reader that read Week before the pick
+
+    version, rec = commit_pick(m, wk.id, mu.id, fx.id)
+    state = m.week_states.get(stale)
+    assert state.version == version  # labelled with the version its rows belong to
+    m.week_states.add_pick(wk.id, version, rec)  # make_pick's patch arriving after that reload
+
+    assert [p.id for p in state.picks_by_matchup[mu.id]] == [rec.id]
+    view = m.load_matchups_view(db, week(db, 1))
+    assert len(view[0]["log"]) == 1
+    assert view[0]["turn_id"] == m.turn_after(mu, 1)
+
+
+def test_add_pick_is_idempotent(app_module):
+    m = app_module
+    db = m.SessionLocal()
+    wk = week(db, 1)
+    mu = db.query(m.Matchup).filter_by(week_id=wk.id).order_by(m.Matchup.id).first()
+    fx = db.query(m.Fixture).filter_by(week_id=wk.id).order_by(m.Fixture.match_number).first()
+    state = m.week_states.get(wk)
+    version, rec = commit_pick(m, wk.id, mu.id, fx.id)
+
+    m.week_states.add_pick(wk.id, version, rec)
+    m.week_states.add_pick(wk.id, version + 1, rec)
+    assert [p.id for p in state.picks_by_matchup[mu.id]] == [rec.id]
+
+
+def test_patched_state_matches_a_fresh_load(client, app_module):
+    m = app_module
+    db = m.SessionLocal()
+    wk = week(db, 1)
+    client.get("/partials/matchups/1")  # warm the cache so the routes patch it
+    fixtures = db.query(m.Fixture).filter_by(week_id=wk.id).order_by(m.Fixture.match_number).all()
+    for mu in db.query(m.Matchup).filter_by(week_id=wk.id).all():
+        for fx in fixtures[:3]:
+            turn = db.get(m.Player, m.compute_next_turn(db, mu)).name
+            with client.session_transaction() as s:
+                s["player_name"] = turn
+            r = client.post("/pick", data={"week": 1, "matchup_id": mu.id, "fixture_id": fx.id, "team": fx.home})
+            assert r.status_code == 200
+    client.post("/set_result", data={"week": 1, "fixture_id": fixtures[0].id, "outcome": "Draw"})
+
+    m.SessionLocal.rollback()
+    wk = week(db, 1)
+    cached, fresh = m.week_states.get(wk), m.WeekState(db, wk)
+    assert m.week_states.stats()["patches"] >= 10
+    dump = lambda st: (st.version, st.results, {k: [(p.id, p.team) for p in v] for k, v in st.picks_by_matchup.items()})
+    assert cached is not fresh and dump(cached) == dump(fresh)
+
+
+def test_writer_batch_keeps_other_jobs_when_one_aborts(app_module):
+    from concurrent.futures import Future
+    from werkzeug.exceptions import BadRequest
+    m = app_module
+
+    def add_player(name):
+        return lambda wdb: wdb.add(m.Player(name=name)) or name
+
+    def reject(wdb):
+        wdb.add(m.Player(name="ghost"))
+        m.abort(400, "nope")
+
+    batch = [(add_player("X1"), Future()), (reject, Future()), (add_player("X2"), Future())]
+    m.writer._commit_batch(batch)
+
+    assert batch[0][1].result() == "X1" and batch[2][1].result() == "X2"
+    assert isinstance(batch[1][1].exception(), BadRequest)
+    names = {n for (n,) in m.SessionLocal().query(m.Player.name)}
+    assert {"X1", "X2"} <= names and "ghost" not in names
+
+
+def test_commit_drops_only_fragments_of_bumped_weeks(app_module):
+    m = app_module
+    db = m.SessionLocal()
+    w1, w2 = week(db, 1), week(db, 2)
+    m.fragment_cache.get_or_render(("scores", w1.id, 0), lambda: "one")
+    m.fragment_cache.get_or_render(("scores", w2.id, 0), lambda: "two")
+    m.bump_week_versions(db, [w1.id])
+    db.commit()
+    assert m.fragment_cache.get_or_render(("scores", w1.id, 0), lambda: "re-rendered") == "re-rendered"
+    assert m.fragment_cache.get_or_render(("scores", w2.id, 0), lambda: "re-rendered") == "two"
+
+
+def test_fixtures_fragment_survives_picks_but_not_fixture_changes(app_module, client):
+    m = app_module
+    db = m.SessionLocal()
+    wk = week(db, 1)
+    client.get("/partials/fixtures/1")
+    misses = m.fragment_cache.misses
+    mu = db.query(m.Matchup).filter_by(week_id=wk.id).order_by(m.Matchup.id).first()
+    fx = db.query(m.Fixture).filter_by(week_id=wk.id).order_by(m.Fixture.match_number).first()
+    commit_pick(m, wk.id, mu.id, fx.id)
+    client.get("/partials/fixtures/1")
+    assert m.fragment_cache.misses == misses  # a pick doesn't touch fixture rows
+
+    m.bump_week_versions(db, [wk.id], fixtures=True)
+    db.commit()
+    client.get("/partials/fixtures/1")
+    assert m.fragment_cache.misses == misses + 1
+
+
+def test_board_api_reads_fixtures_from_the_cached_state(app_module, client, monkeypatch):
+    m = app_module
+    db = m.SessionLocal()
+    wk = week(db, 1)
+    state = m.week_states.get(wk)
+    monkeypatch.setattr(state.fixtures[0], "home", "Cached United")  # only visible through the state
+    board = client.get("/api/v1/weeks/1/board").get_json()
+    assert board["fixtures"][0]["home"] == "Cached United"
+    assert [f["id"] for f in board["fixtures"]] == [f.id for f in state.fixtures]